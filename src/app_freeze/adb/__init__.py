@@ -9,6 +9,7 @@ from app_freeze.adb.errors import (
     ADBTimeoutError,
 )
 from app_freeze.adb.models import AppInfo, DeviceInfo, DeviceState
+from app_freeze.adb.session import ShellSession
 
 __all__ = [
     "ADBClient",
@@ -20,4 +21,5 @@ __all__ = [
     "DeviceInfo",
     "DeviceState",
     "AppInfo",
+    "ShellSession",
 ]
@@ -1,66 +1,164 @@
 """ADB client wrapper for all adb interactions."""
 
+import asyncio
 import concurrent.futures
+import functools
+import os
+import re
+import shlex
 import shutil
 import subprocess
-from collections.abc import Callable
-from typing import Final
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any, Final, TypeVar
 
 from app_freeze.adb.errors import (
     ADBCommandError,
     ADBDeviceDisconnectedError,
     ADBDeviceNotFoundError,
+    ADBError,
     ADBNotFoundError,
     ADBPermissionError,
     ADBTimeoutError,
 )
-from app_freeze.adb.models import AppInfo, DeviceCache, DeviceInfo
+from app_freeze.adb.models import AppInfo, AppListCache, DeviceCache, DeviceInfo, DeviceState
 from app_freeze.adb.parser import (
     parse_devices_output,
     parse_du_output,
     parse_dumpsys_package,
+    parse_getprop_output,
     parse_package_path,
     parse_packages_output,
     parse_users_output,
 )
+from app_freeze.adb.session import ShellSession
 
 DEFAULT_TIMEOUT: Final[float] = 30.0
 PROP_TIMEOUT: Final[float] = 5.0
+DEVICES_CACHE_TTL: Final[float] = 0.5
+APP_INFO_TIMEOUT: Final[float] = 10.0
+SERVER_START_TIMEOUT: Final[float] = 5.0
+MAX_CONCURRENT_SHELLS: Final[int] = 16
+SECTION_DELIMITER: Final[str] = "::APPFREEZE::"
+OUTPUT_ENCODING: Final[str] = "utf-8"
+# Python creates fds non-inheritable, so skipping the close pass is safe on POSIX
+# and keeps subprocess on its posix_spawn/vfork fast path
+CLOSE_FDS: Final[bool] = sys.platform == "win32"
+
+# stderr classification: "device" plus a disconnect keyword anywhere, in any order
+_DEVICE_GONE_RE: Final = re.compile(
+    r"(?=.*device)(?=.*(?:not found|offline|disconnected))", re.I | re.S
+)
+_PERMISSION_RE: Final = re.compile(r"permission denied|insufficient permissions", re.I)
+# Characters of stderr examined when classifying a failure
+STDERR_SCAN_LIMIT: Final[int] = 512
+
+# Printed after each user's pm output in batched enable/disable scripts
+USER_SENTINEL: Final[str] = "::APPFREEZE_USER::"
+# Printed after each user's pm command as "<sentinel><user id>:<pm exit status>"
+_USER_SENTINEL_RE: Final = re.compile(rf"^{USER_SENTINEL}\d+:(\d+)\r?\n?", re.M)
+
+# Parsed 'adb devices -l' output: (device_id, state, properties)
+ParsedDevices = list[tuple[str, DeviceState, dict[str, str]]]
+
+_T = TypeVar("_T")
+
+
+def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from sync code, even inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from an event loop thread (e.g. a UI key handler): use a private loop
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _cache_dir() -> Path:
+    """Directory for persistent caches (honours XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "app-freeze"
+
+
+def _device_cache_path() -> Path:
+    """Location of the persistent device cache."""
+    return _cache_dir() / "devices.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_adb() -> str:
+    """Find adb binary in PATH. Successful lookups are cached for the process lifetime."""
+    path = shutil.which("adb")
+    if not path:
+        raise ADBNotFoundError()
+    return path
 
 
 class ADBClient:
     """Client for ADB command execution with caching and error handling."""
 
-    def __init__(self, adb_path: str | None = None, default_timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        adb_path: str | None = None,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        persist: bool = False,
+        warmup: bool = False,
+    ):
         """
         Initialize ADB client.
 
         Args:
             adb_path: Explicit path to adb binary. If None, searches PATH.
             default_timeout: Default timeout for adb commands in seconds.
+            persist: If True, device info and app lists are cached on disk across runs.
+            warmup: If True, start the adb server now rather than on the first command.
         """
-        self._adb_path = adb_path or self._find_adb()
+        self._adb_path = adb_path or _resolve_adb()
         self._default_timeout = default_timeout
-        self._cache = DeviceCache()
-
-    @staticmethod
-    def _find_adb() -> str:
-        """Find adb binary in PATH."""
-        path = shutil.which("adb")
-        if not path:
-            raise ADBNotFoundError()
-        return path
+        self._cache = DeviceCache(path=_device_cache_path() if persist else None)
+        self._app_cache = AppListCache(_cache_dir() / "apps") if persist else None
+        # (monotonic timestamp, parsed 'adb devices -l' output)
+        self._devices_snapshot: tuple[float, ParsedDevices] | None = None
+        # device_id -> (adb, "-s", device_id)
+        self._cmd_prefixes: dict[str, tuple[str, ...]] = {}
+        if warmup:
+            self.start_server()
 
     @staticmethod
     def check_adb_available() -> bool:
         """Check if adb is available on the system."""
-        return shutil.which("adb") is not None
+        try:
+            _resolve_adb()
+        except ADBNotFoundError:
+            return False
+        return True
+
+    def start_server(self) -> bool:
+        """
+        Start the adb server if it is not running.
+
+        A cold server start takes about a second; doing it up front keeps that
+        stall out of the first device query.
+
+        Returns:
+            True if the server is running.
+        """
+        try:
+            self._run(["start-server"], timeout=SERVER_START_TIMEOUT)
+        except ADBError:
+            return False
+        return True
 
     def _run(
         self,
         args: list[str],
         timeout: float | None = None,
         device_id: str | None = None,
+        large_output: bool = False,
     ) -> tuple[str, str]:
         """
         Execute an adb command.
@@ -69,6 +167,8 @@ class ADBClient:
             args: Command arguments (without 'adb' prefix).
             timeout: Command timeout in seconds.
             device_id: Target device ID for the command.
+            large_output: If True, spool output to temporary files instead of pipes.
+                          Cheaper for multi-KB outputs like dumpsys.
 
         Returns:
             Tuple of (stdout, stderr).
@@ -77,59 +177,109 @@ class ADBClient:
             ADBTimeoutError: If command times out.
             ADBCommandError: If command fails.
         """
-        cmd = [self._adb_path]
-        if device_id:
-            cmd.extend(["-s", device_id])
-        cmd.extend(args)
-
+        cmd = self._build_cmd(args, device_id)
         timeout = timeout or self._default_timeout
-        cmd_str = " ".join(cmd)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-            )
+            if large_output:
+                returncode, raw_stdout, raw_stderr = self._run_spooled(cmd, timeout)
+            else:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    timeout=timeout,
+                    check=False,
+                    close_fds=CLOSE_FDS,
+                )
+                returncode, raw_stdout, raw_stderr = result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired as e:
-            raise ADBTimeoutError(cmd_str, timeout) from e
+            raise ADBTimeoutError(" ".join(cmd), timeout) from e
+
+        return self._check_result(args, device_id, cmd, returncode, raw_stdout, raw_stderr)
 
-        if result.returncode != 0:
-            stderr_lower = result.stderr.lower()
+    def _build_cmd(self, args: list[str], device_id: str | None) -> list[str]:
+        """Build the full adb command line."""
+        if not device_id:
+            return [self._adb_path, *args]
+        prefix = self._cmd_prefixes.get(device_id)
+        if prefix is None:
+            prefix = self._cmd_prefixes[device_id] = (self._adb_path, "-s", device_id)
+        return [*prefix, *args]
+
+    @staticmethod
+    def _check_result(
+        args: list[str],
+        device_id: str | None,
+        cmd: list[str],
+        returncode: int,
+        raw_stdout: bytes,
+        raw_stderr: bytes,
+    ) -> tuple[str, str]:
+        """
+        Decode command output and map failures to ADB errors.
+
+        Returns:
+            Tuple of (stdout, stderr).
+        """
+        # Decode raw output once; adb output is UTF-8 regardless of host locale
+        stdout = raw_stdout.decode(OUTPUT_ENCODING, "replace")
+        stderr = raw_stderr.decode(OUTPUT_ENCODING, "replace")
+
+        if returncode != 0:
+            # adb error lines are short; don't scan long command output
+            head = stderr[:STDERR_SCAN_LIMIT]
 
             # Check for device disconnected/not found error
-            if "device" in stderr_lower and (
-                "not found" in stderr_lower
-                or "offline" in stderr_lower
-                or "disconnected" in stderr_lower
-            ):
+            if _DEVICE_GONE_RE.match(head):
                 if device_id:
                     raise ADBDeviceDisconnectedError(device_id)
                 raise ADBDeviceNotFoundError(device_id or "unknown")
 
             # Check for permission errors
-            if "permission denied" in stderr_lower or "insufficient permissions" in stderr_lower:
+            if _PERMISSION_RE.search(head):
                 operation = " ".join(args[:2]) if len(args) >= 2 else " ".join(args)
                 raise ADBPermissionError(operation, device_id or "unknown")
 
-            raise ADBCommandError(cmd_str, result.returncode, result.stderr)
+            raise ADBCommandError(" ".join(cmd), returncode, stderr)
+
+        return stdout, stderr
+
+    @staticmethod
+    def _run_spooled(cmd: list[str], timeout: float) -> tuple[int, bytes, bytes]:
+        """
+        Run a command with stdout/stderr redirected to temporary files.
+
+        Avoids the pipe read loop in communicate(), which is CPU-heavy for large outputs.
 
-        return result.stdout, result.stderr
+        Returns:
+            Tuple of (returncode, stdout, stderr).
+        """
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            result = subprocess.run(
+                cmd, stdout=out, stderr=err, timeout=timeout, check=False, close_fds=CLOSE_FDS
+            )
+            out.seek(0)
+            err.seek(0)
+            return result.returncode, out.read(), err.read()
 
     def list_devices(self, use_cache: bool = False) -> list[DeviceInfo]:
         """
         List all connected devices.
 
         Args:
-            use_cache: If True, returns cached device info when available.
+            use_cache: If True, returns cached device info when available and reuses
+                       a device listing fetched within the last DEVICES_CACHE_TTL seconds.
 
         Returns:
             List of connected devices with basic info.
         """
-        stdout, _ = self._run(["devices", "-l"], timeout=PROP_TIMEOUT)
-        parsed = parse_devices_output(stdout)
+        snapshot = self._devices_snapshot
+        if use_cache and snapshot and time.monotonic() - snapshot[0] < DEVICES_CACHE_TTL:
+            parsed = snapshot[1]
+        else:
+            stdout, _ = self._run(["devices", "-l"], timeout=PROP_TIMEOUT)
+            parsed = parse_devices_output(stdout)
+            self._devices_snapshot = (time.monotonic(), parsed)
 
         devices: list[DeviceInfo] = []
         for device_id, state, props in parsed:
@@ -158,7 +308,7 @@ class ADBClient:
         Returns:
             List of devices with state == DEVICE (connected and ready).
         """
-        all_devices = self.list_devices()
+        all_devices = self.list_devices(use_cache=True)
         return [d for d in all_devices if d.is_ready]
 
     def validate_device(self, device_id: str) -> DeviceInfo:
@@ -174,7 +324,7 @@ class ADBClient:
         Raises:
             ADBDeviceNotFoundError: If device not found or not ready.
         """
-        devices = self.list_devices()
+        devices = self.list_devices(use_cache=True)
         device = next((d for d in devices if d.device_id == device_id), None)
         if device is None:
             raise ADBDeviceNotFoundError(device_id)
@@ -233,7 +383,7 @@ class ADBClient:
                 return cached
 
         # Verify device exists
-        devices = self.list_devices()
+        devices = self.list_devices(use_cache=True)
         device = next((d for d in devices if d.device_id == device_id), None)
         if device is None:
             raise ADBDeviceNotFoundError(device_id)
@@ -241,11 +391,12 @@ class ADBClient:
         if not device.is_ready:
             return device
 
-        # Fetch detailed properties
-        model = self._get_prop(device_id, "ro.product.model")
-        manufacturer = self._get_prop(device_id, "ro.product.manufacturer")
-        android_version = self._get_prop(device_id, "ro.build.version.release")
-        sdk_str = self._get_prop(device_id, "ro.build.version.sdk")
+        # Fetch detailed properties in a single round-trip
+        props = self._get_props_bulk(device_id)
+        model = props.get("ro.product.model", "")
+        manufacturer = props.get("ro.product.manufacturer", "")
+        android_version = props.get("ro.build.version.release", "")
+        sdk_str = props.get("ro.build.version.sdk", "")
 
         try:
             sdk_level = int(sdk_str) if sdk_str else 0
@@ -279,6 +430,18 @@ class ADBClient:
         except (ADBCommandError, ADBTimeoutError):
             return ""
 
+    def _get_props_bulk(self, device_id: str) -> dict[str, str]:
+        """Get all device properties with a single getprop call."""
+        try:
+            stdout, _ = self._run(
+                ["shell", "getprop"],
+                device_id=device_id,
+                timeout=PROP_TIMEOUT,
+            )
+            return parse_getprop_output(stdout)
+        except (ADBCommandError, ADBTimeoutError):
+            return {}
+
     def list_users(self, device_id: str) -> list[int]:
         """
         List all user IDs on the device.
@@ -299,6 +462,7 @@ class ADBClient:
         Args:
             device_id: Specific device to invalidate, or None for all.
         """
+        self._devices_snapshot = None
         if device_id:
             self._cache.invalidate(device_id)
         else:
@@ -321,17 +485,37 @@ class ADBClient:
         Returns:
             List of package names.
         """
-        packages: set[str] = set()
-
-        if system_apps:
+        if system_apps and user_apps:
+            # Unfiltered listing covers both partitions in one round-trip
+            stdout, _ = self._run(
+                ["shell", "pm", "list", "packages"], device_id=device_id, large_output=True
+            )
+        elif system_apps:
             stdout, _ = self._run(["shell", "pm", "list", "packages", "-s"], device_id=device_id)
-            packages.update(parse_packages_output(stdout))
-
-        if user_apps:
+        elif user_apps:
             stdout, _ = self._run(["shell", "pm", "list", "packages", "-3"], device_id=device_id)
-            packages.update(parse_packages_output(stdout))
+        else:
+            return []
 
-        return sorted(packages)
+        # Parser output is already unique, so a single sort is enough
+        return sorted(parse_packages_output(stdout))
+
+    def list_disabled_packages(self, device_id: str, user_id: int = 0) -> set[str]:
+        """
+        List packages disabled for a user.
+
+        Args:
+            device_id: Target device ID.
+            user_id: User ID to check.
+
+        Returns:
+            Set of disabled package names.
+        """
+        stdout, _ = self._run(
+            ["shell", "pm", "list", "packages", "-d", "--user", str(user_id)],
+            device_id=device_id,
+        )
+        return set(parse_packages_output(stdout))
 
     def get_app_info(
         self,
@@ -339,6 +523,7 @@ class ADBClient:
         package_name: str,
         user_id: int = 0,
         fetch_size: bool = False,
+        system_packages: set[str] | None = None,
     ) -> AppInfo:
         """
         Get detailed information about a specific app.
@@ -348,29 +533,88 @@ class ADBClient:
             package_name: Package name to query.
             user_id: User ID for app state check.
             fetch_size: If True, fetch app size (slower).
+            system_packages: Prefetched system package names. If given, skips the
+                             per-package system app lookup.
 
         Returns:
             App information.
         """
         # Determine if it's a system app
-        is_system = self._is_system_app(device_id, package_name)
+        if system_packages is not None:
+            is_system = package_name in system_packages
+        else:
+            is_system = self._is_system_app(device_id, package_name)
 
-        # Get enabled state, version code, and app label via dumpsys
-        dumpsys_stdout, _ = self._run(
-            ["shell", "dumpsys", "package", package_name],
+        stdout, _ = self._run(
+            self._app_info_args(package_name, fetch_size),
             device_id=device_id,
-            timeout=10.0,
+            timeout=APP_INFO_TIMEOUT,
+            large_output=True,
         )
+        return self._parse_app_info(package_name, stdout, user_id, fetch_size, is_system)
+
+    async def _get_app_info_async(
+        self,
+        session: ShellSession,
+        package_name: str,
+        user_id: int,
+        fetch_size: bool,
+        is_system: bool,
+    ) -> AppInfo:
+        """Async variant of get_app_info over a shell session, with a known system flag."""
+        stdout = await session.run(
+            self._app_info_command(package_name, fetch_size), timeout=APP_INFO_TIMEOUT
+        )
+        return self._parse_app_info(package_name, stdout, user_id, fetch_size, is_system)
+
+    def shell_session(self, device_id: str) -> ShellSession:
+        """
+        Create a persistent 'adb shell' session for a device.
+
+        The session starts on first use and must be closed by the caller
+        (or used as an async context manager).
+        """
+        return ShellSession(self._build_cmd(["shell"], device_id), device_id)
+
+    @classmethod
+    def _app_info_args(cls, package_name: str, fetch_size: bool) -> list[str]:
+        """Build adb args for an app info query."""
+        if fetch_size:
+            # Chain dumpsys, pm path and du in one shell round-trip
+            return ["shell", cls._app_info_script(package_name)]
+        return ["shell", "dumpsys", "package", package_name]
+
+    @classmethod
+    def _app_info_command(cls, package_name: str, fetch_size: bool) -> str:
+        """Build a shell command line for an app info query inside a session."""
+        if fetch_size:
+            return cls._app_info_script(package_name)
+        return f"dumpsys package {shlex.quote(package_name)}"
+
+    @staticmethod
+    def _parse_app_info(
+        package_name: str,
+        stdout: str,
+        user_id: int,
+        fetch_size: bool,
+        is_system: bool,
+    ) -> AppInfo:
+        """Build AppInfo from the output of an _app_info_args command."""
+        size_mb = 0.0
+        if fetch_size:
+            dumpsys_stdout, _, rest = stdout.partition(SECTION_DELIMITER)
+            path_stdout, _, size_stdout = rest.partition(SECTION_DELIMITER)
+            if parse_package_path(path_stdout):
+                size_mb = parse_du_output(size_stdout)
+        else:
+            dumpsys_stdout = stdout
+
+        # Get enabled state, version code, and app label via dumpsys
         metadata = parse_dumpsys_package(dumpsys_stdout, user_id)
         is_enabled = bool(metadata.get("enabled", True))
         version_code = int(metadata.get("version_code", 0))
         app_label = str(metadata.get("app_label", ""))
 
-        # Optionally get app size
-        size_mb = 0.0
-        if fetch_size:
-            size_mb = self._get_app_size(device_id, package_name)
-
         return AppInfo(
             package_name=package_name,
             is_system=is_system,
@@ -388,6 +632,7 @@ class ADBClient:
         include_user: bool = True,
         fetch_sizes: bool = False,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        fast_mode: bool = False,
     ) -> list[AppInfo]:
         """
         List all apps on the device with detailed information.
@@ -399,43 +644,143 @@ class ADBClient:
             include_user: Include third-party apps.
             fetch_sizes: If True, fetch app sizes (much slower).
             progress_callback: Optional callback(package_name, current, total) for progress.
+            fast_mode: If True, read enabled state from 'pm list packages -d' and skip
+                       per-app queries. Version code, label and size are left unset.
 
         Returns:
             Sorted list of app information.
         """
-        packages = self.list_packages(device_id, include_system, include_user)
-        apps: list[AppInfo] = []
+        return _run_sync(
+            self.list_apps_async(
+                device_id,
+                user_id,
+                include_system,
+                include_user,
+                fetch_sizes,
+                progress_callback,
+                fast_mode,
+            )
+        )
+
+    async def list_apps_async(
+        self,
+        device_id: str,
+        user_id: int = 0,
+        include_system: bool = True,
+        include_user: bool = True,
+        fetch_sizes: bool = False,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+        fast_mode: bool = False,
+    ) -> list[AppInfo]:
+        """
+        Async variant of list_apps.
+
+        Per-package queries run over a pool of up to MAX_CONCURRENT_SHELLS
+        persistent adb shell sessions on the event loop.
+        """
+        packages = await asyncio.to_thread(
+            self.list_packages, device_id, include_system, include_user
+        )
+        # Order packages as displayed up front; results below keep this order
+        packages.sort(key=str.lower)
         total = len(packages)
         completed = 0
 
-        def fetch_app(package: str) -> AppInfo | None:
+        # Resolve system apps once up front instead of one adb call per package
+        if include_system and include_user:
+            system_packages = set(
+                await asyncio.to_thread(self.list_packages, device_id, True, False)
+            )
+        elif include_system:
+            system_packages = set(packages)
+        else:
+            system_packages = set()
+
+        if fast_mode:
+            disabled = await asyncio.to_thread(self.list_disabled_packages, device_id, user_id)
+            fast_apps: list[AppInfo] = []
+            for package in packages:
+                fast_apps.append(
+                    AppInfo(
+                        package_name=package,
+                        is_system=package in system_packages,
+                        is_enabled=package not in disabled,
+                    )
+                )
+                completed += 1
+                if progress_callback:
+                    progress_callback(package, completed, total)
+            return fast_apps
+
+        # A pool of long-lived shells replaces one adb process per package
+        sessions: asyncio.Queue[ShellSession] = asyncio.Queue()
+        pool = [self.shell_session(device_id) for _ in range(min(MAX_CONCURRENT_SHELLS, total))]
+        for session in pool:
+            sessions.put_nowait(session)
+
+        async def fetch_app(package: str) -> AppInfo | None:
             """Fetch single app info, returns None on error."""
+            nonlocal completed
+            session = await sessions.get()
             try:
-                return self.get_app_info(device_id, package, user_id, fetch_sizes)
-            except (ADBCommandError, ADBTimeoutError):
-                return None
+                app_info: AppInfo | None = await self._get_app_info_async(
+                    session, package, user_id, fetch_sizes, package in system_packages
+                )
+            except Exception:
+                # Skip apps that fail
+                app_info = None
+            finally:
+                sessions.put_nowait(session)
+            completed += 1
+            if progress_callback:
+                progress_callback(package, completed, total)
+            return app_info
 
-        # Use ThreadPoolExecutor for parallel fetching (max 8 workers)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            # Submit all tasks
-            future_to_pkg = {executor.submit(fetch_app, pkg): pkg for pkg in packages}
+        try:
+            results = await asyncio.gather(*(fetch_app(pkg) for pkg in packages))
+        finally:
+            await asyncio.gather(*(session.close() for session in pool))
+        # gather() returns results in package order, already sorted alphabetically
+        return [app for app in results if app is not None]
 
-            # Process as they complete
-            for future in concurrent.futures.as_completed(future_to_pkg):
-                completed += 1
-                pkg = future_to_pkg[future]
-                if progress_callback:
-                    progress_callback(pkg, completed, total)
-                try:
-                    app_info = future.result()
-                    if app_info:
-                        apps.append(app_info)
-                except Exception:
-                    # Skip apps that fail
-                    pass
+    def load_cached_apps(self, device_id: str) -> list[AppInfo] | None:
+        """
+        Get the app list saved by save_cached_apps for this device build.
+
+        Args:
+            device_id: Target device ID.
+
+        Returns:
+            Cached apps, or None if persistence is off, nothing fresh is cached,
+            or the device build changed since.
+        """
+        if self._app_cache is None:
+            return None
+        return self._app_cache.get(device_id, self._live_fingerprint(device_id))
+
+    def save_cached_apps(self, device_id: str, apps: list[AppInfo]) -> None:
+        """
+        Save a full app list for load_cached_apps on a later run.
 
-        # Sort alphabetically by package name
-        return sorted(apps, key=lambda a: a.package_name.lower())
+        Args:
+            device_id: Target device ID.
+            apps: Apps as returned by list_apps.
+        """
+        if self._app_cache is None:
+            return
+        self._app_cache.set(device_id, self._live_fingerprint(device_id), apps)
+
+    def _live_fingerprint(self, device_id: str) -> str:
+        """
+        Read the build fingerprint from the device, bypassing the device info cache.
+
+        The persisted device info can predate a system update, so app-list cache
+        keys are always taken from the live property. Returns "" if unavailable.
+        """
+        try:
+            return self._get_prop(device_id, "ro.build.fingerprint")
+        except ADBError:
+            return ""
 
     def _is_system_app(self, device_id: str, package_name: str) -> bool:
         """Check if a package is a system app."""
@@ -450,28 +795,16 @@ class ADBClient:
         except (ADBCommandError, ADBTimeoutError):
             return False
 
-    def _get_app_size(self, device_id: str, package_name: str) -> float:
-        """Get app size in MB."""
-        try:
-            # Get package path
-            path_stdout, _ = self._run(
-                ["shell", "pm", "path", package_name],
-                device_id=device_id,
-                timeout=PROP_TIMEOUT,
-            )
-            app_dir = parse_package_path(path_stdout)
-            if not app_dir:
-                return 0.0
-
-            # Get directory size
-            size_stdout, _ = self._run(
-                ["shell", "du", "-sh", app_dir],
-                device_id=device_id,
-                timeout=10.0,
-            )
-            return parse_du_output(size_stdout)
-        except (ADBCommandError, ADBTimeoutError, ADBPermissionError):
-            return 0.0
+    @staticmethod
+    def _app_info_script(package_name: str) -> str:
+        """Build a shell script printing dumpsys, pm path and du output for a package."""
+        pkg = shlex.quote(package_name)
+        return (
+            f"dumpsys package {pkg}; echo {SECTION_DELIMITER}; "
+            f'p=$(pm path {pkg}); echo "$p"; echo {SECTION_DELIMITER}; '
+            'b=$(echo "$p" | grep base.apk | head -n 1); b=${b#package:}; '
+            'if [ -n "$b" ]; then du -sh "${b%/base.apk}" 2>/dev/null; fi; true'
+        )
 
     def disable_app(
         self,
@@ -496,14 +829,7 @@ class ADBClient:
                 device_id=device_id,
                 timeout=10.0,
             )
-            # Check for success indicators
-            output = stdout + stderr
-            if "disabled" in output.lower() or "new state" in output.lower():
-                return True, None
-            if "error" in output.lower() or "exception" in output.lower():
-                return False, output.strip()
-            # Assume success if no error
-            return True, None
+            return self._check_pm_output(stdout + stderr, "disabled")
         except ADBCommandError as e:
             return False, str(e)
         except ADBTimeoutError as e:
@@ -532,34 +858,44 @@ class ADBClient:
                 device_id=device_id,
                 timeout=10.0,
             )
-            # Check for success indicators
-            output = stdout + stderr
-            if "enabled" in output.lower() or "new state" in output.lower():
-                return True, None
-            if "error" in output.lower() or "exception" in output.lower():
-                return False, output.strip()
-            # Assume success if no error
-            return True, None
+            return self._check_pm_output(stdout + stderr, "enabled")
         except ADBCommandError as e:
             return False, str(e)
         except ADBTimeoutError as e:
             return False, str(e)
 
+    @staticmethod
+    def _check_pm_output(output: str, success_word: str) -> tuple[bool, str | None]:
+        """Interpret 'pm enable/disable-user' output as (success, error_message)."""
+        # Check for success indicators
+        lowered = output.lower()
+        if success_word in lowered or "new state" in lowered:
+            return True, None
+        if "error" in lowered or "exception" in lowered:
+            return False, output.strip()
+        # Assume success if no error
+        return True, None
+
     def enable_disable_apps(
         self,
         device_id: str,
         packages: list[str],
         enable: bool,
         user_ids: list[int] | None = None,
+        progress_callback: Callable[[str, bool, str | None], None] | None = None,
     ) -> dict[str, tuple[bool, str | None]]:
         """
         Enable or disable multiple apps for all users.
 
+        All packages are processed over a single adb shell session.
+
         Args:
             device_id: Target device ID.
             packages: List of package names.
             enable: True to enable, False to disable.
             user_ids: List of user IDs (fetches from device if None).
+            progress_callback: Optional callback(package_name, success, error_message),
+                               called as each package finishes.
 
         Returns:
             Dict mapping package_name to (success, error_message).
@@ -569,20 +905,66 @@ class ADBClient:
             if not user_ids:
                 user_ids = [0]
 
-        results: dict[str, tuple[bool, str | None]] = {}
-        action = self.enable_app if enable else self.disable_app
-
-        for package in packages:
-            # Execute for all users, track overall success
-            all_success = True
-            last_error: str | None = None
+        return _run_sync(
+            self._enable_disable_apps_async(
+                device_id, packages, enable, user_ids, progress_callback
+            )
+        )
 
-            for user_id in user_ids:
-                success, error = action(device_id, package, user_id)
-                if not success:
-                    all_success = False
-                    last_error = error
+    async def _enable_disable_apps_async(
+        self,
+        device_id: str,
+        packages: list[str],
+        enable: bool,
+        user_ids: list[int],
+        progress_callback: Callable[[str, bool, str | None], None] | None,
+    ) -> dict[str, tuple[bool, str | None]]:
+        """Async body of enable_disable_apps."""
+        results: dict[str, tuple[bool, str | None]] = {}
+        verb = "enable" if enable else "disable-user"
+        success_word = "enabled" if enable else "disabled"
+
+        async with self.shell_session(device_id) as session:
+            for package in packages:
+                # One command per package, with a sentinel after each user's output
+                pkg = shlex.quote(package)
+                script = "; ".join(
+                    f"pm {verb} --user {user_id} {pkg} 2>&1; echo {USER_SENTINEL}{user_id}:$?"
+                    for user_id in user_ids
+                )
+                try:
+                    stdout = await session.run(script, timeout=10.0 * len(user_ids))
+                    results[package] = self._check_user_outputs(stdout, user_ids, success_word)
+                except ADBError as e:
+                    results[package] = (False, str(e))
 
-            results[package] = (all_success, last_error)
+                if progress_callback:
+                    progress_callback(package, *results[package])
 
         return results
+
+    @classmethod
+    def _check_user_outputs(
+        cls, stdout: str, user_ids: list[int], success_word: str
+    ) -> tuple[bool, str | None]:
+        """Combine per-user pm results from a sentinel-delimited script output."""
+        # Alternating (output, exit status) per user that finished, then whatever
+        # follows the last sentinel
+        parts = _USER_SENTINEL_RE.split(stdout)
+        count = 2 * len(user_ids)
+        if len(parts) <= count:
+            return False, stdout.strip() or None
+
+        # Track overall success
+        all_success = True
+        last_error: str | None = None
+        for output, status in zip(parts[0:count:2], parts[1:count:2], strict=True):
+            if status != "0":
+                success, error = False, output.strip() or f"pm exited with status {status}"
+            else:
+                success, error = cls._check_pm_output(output, success_word)
+            if not success:
+                all_success = False
+                last_error = error
+
+        return all_success, last_error
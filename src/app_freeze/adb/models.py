@@ -1,7 +1,13 @@
 """Data models for ADB responses."""
 
-from dataclasses import dataclass, field
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from pathlib import Path
 
 
 class DeviceState(Enum):
@@ -16,7 +22,7 @@ class DeviceState(Enum):
     UNKNOWN = "unknown"  # Unknown state
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceInfo:
     """Complete Android device information."""
 
@@ -28,6 +34,17 @@ class DeviceInfo:
     sdk_level: int = 0
     product: str = ""
     transport_id: int = 0
+    # Derived from the fields above in __post_init__
+    _display_name: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.model and self.manufacturer:
+            name = f"{self.manufacturer} {self.model}"
+        elif self.model:
+            name = self.model
+        else:
+            name = self.device_id
+        object.__setattr__(self, "_display_name", name)
 
     @property
     def is_ready(self) -> bool:
@@ -37,14 +54,10 @@ class DeviceInfo:
     @property
     def display_name(self) -> str:
         """Human-readable device name."""
-        if self.model and self.manufacturer:
-            return f"{self.manufacturer} {self.model}"
-        if self.model:
-            return self.model
-        return self.device_id
+        return self._display_name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppInfo:
     """Android application information."""
 
@@ -54,36 +67,171 @@ class AppInfo:
     size_mb: float = 0.0
     version_code: int = 0
     app_label: str = ""  # Actual app name from Android manifest
+    # Derived from the fields above in __post_init__
+    _display_name: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Use actual app label if available, otherwise derive from package
+        name = self.app_label
+        if not name:
+            # Fallback: extract from package (e.g., com.android.chrome -> Chrome)
+            name = self.package_name.rpartition(".")[2].replace("_", " ").title()
+        object.__setattr__(self, "_display_name", name)
 
     @property
     def display_name(self) -> str:
         """Human-readable app name."""
-        # Use actual app label if available, otherwise derive from package
-        if self.app_label:
-            return self.app_label
-        # Fallback: extract from package (e.g., com.android.chrome -> Chrome)
-        parts = self.package_name.split(".")
-        return parts[-1].replace("_", " ").title()
+        return self._display_name
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCache:
-    """Cache for device information to avoid redundant adb calls."""
-
-    _cache: dict[str, DeviceInfo] = field(default_factory=dict)
+    """Cache for device information to avoid redundant adb calls.
+
+    Holds at most max_entries devices, evicting the least recently used. If ttl
+    is set, entries older than ttl seconds are treated as missing.
+
+    If a path is given, entries are persisted as JSON so static device properties
+    survive process restarts. Only ready devices saved less than max_age seconds
+    ago are restored on load, so properties changed by a system update are
+    eventually re-read.
+    """
+
+    # device_id -> (monotonic timestamp, wall-clock save time, info), least recently used first
+    _cache: OrderedDict[str, tuple[float, float, DeviceInfo]] = field(default_factory=OrderedDict)
+    path: Path | None = None
+    ttl: float | None = None
+    max_age: float = 24 * 60 * 60
+    max_entries: int = 16
+    _loaded: bool = False
+    # Devices may be queried from several threads at once
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def get(self, device_id: str) -> DeviceInfo | None:
         """Get cached device info."""
-        return self._cache.get(device_id)
+        with self._lock:
+            self._load()
+            entry = self._cache.get(device_id)
+            if entry is None:
+                return None
+            timestamp, _, info = entry
+            if self.ttl is not None and time.monotonic() - timestamp >= self.ttl:
+                del self._cache[device_id]
+                return None
+            self._cache.move_to_end(device_id)
+            return info
 
     def set(self, device_id: str, info: DeviceInfo) -> None:
         """Cache device info."""
-        self._cache[device_id] = info
+        with self._lock:
+            self._load()
+            self._put(device_id, info)
+            self._save()
 
     def invalidate(self, device_id: str) -> None:
         """Invalidate cache for a specific device."""
-        self._cache.pop(device_id, None)
+        with self._lock:
+            self._load()
+            if self._cache.pop(device_id, None) is not None:
+                self._save()
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._cache.clear()
+        with self._lock:
+            self._loaded = True
+            self._cache.clear()
+            self._save()
+
+    def _put(self, device_id: str, info: DeviceInfo, saved_at: float | None = None) -> None:
+        """Insert an entry as most recently used, evicting the oldest if full."""
+        wall_time = time.time() if saved_at is None else saved_at
+        self._cache[device_id] = (time.monotonic(), wall_time, info)
+        self._cache.move_to_end(device_id)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _load(self) -> None:
+        """Lazily load persisted entries on first access."""
+        if self._loaded or self.path is None:
+            return
+        self._loaded = True
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            now = time.time()
+            for device_id, entry in raw.items():
+                # Entries without a save time predate it and are treated as expired
+                saved_at = float(entry.pop("saved_at", 0.0))
+                if now - saved_at >= self.max_age:
+                    continue
+                info = DeviceInfo(**{**entry, "state": DeviceState(entry["state"])})
+                if info.is_ready and device_id not in self._cache:
+                    self._put(device_id, info, saved_at)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Missing or corrupt cache file - start empty
+            pass
+
+    def _save(self) -> None:
+        """Persist entries to disk. Failures are ignored; the cache is best-effort."""
+        if self.path is None:
+            return
+        data = {
+            device_id: {f.name: getattr(info, f.name) for f in fields(DeviceInfo) if f.init}
+            | {"state": info.state.value, "saved_at": saved_at}
+            for device_id, (_, saved_at, info) in self._cache.items()
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            pass
+
+
+# Characters not safe in a cache file name (device ids may be "host:port")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]")
+
+
+@dataclass(slots=True)
+class AppListCache:
+    """On-disk cache of a device's full app list, one JSON file per device.
+
+    An entry is only returned for the build fingerprint it was saved with and
+    while the file is younger than ttl seconds. Callers pass the fingerprint
+    read live from the device, so a system update or a stale file falls back
+    to a fresh listing. All failures read as a cache miss.
+    """
+
+    directory: Path
+    ttl: float = 3600.0
+
+    def get(self, device_id: str, fingerprint: str) -> list[AppInfo] | None:
+        """Get the cached app list for a device build, or None."""
+        if not fingerprint:
+            return None
+        path = self._path(device_id)
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw["fingerprint"] != fingerprint:
+                return None
+            return [AppInfo(**entry) for entry in raw["apps"]]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def set(self, device_id: str, fingerprint: str, apps: list[AppInfo]) -> None:
+        """Save a device's app list. Failures are ignored; the cache is best-effort."""
+        if not fingerprint:
+            return
+        names = [f.name for f in fields(AppInfo) if f.init]
+        data = {
+            "fingerprint": fingerprint,
+            "apps": [{name: getattr(app, name) for name in names} for app in apps],
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(device_id).write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _path(self, device_id: str) -> Path:
+        return self.directory / f"{_UNSAFE_FILENAME_RE.sub('_', device_id)}.json"
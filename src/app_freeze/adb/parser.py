@@ -4,18 +4,44 @@ import re
 
 from app_freeze.adb.models import DeviceState
 
+# Pattern: [ro.product.model]: [Pixel 7]
+_GETPROP_RE = re.compile(r"^\[([^\]]+)\]: \[(.*)\]\r?$", re.M)
+# First line of 'adb devices' output
+_DEVICES_HEADER = "List of devices attached"
+# Pattern: UserInfo{0:Owner:flags}
+_USER_RE = re.compile(r"UserInfo\{(\d+):")
+# Single pass over dumpsys output; the user pattern stays within one line
+_DUMPSYS_RE = re.compile(
+    # Anchored to the start of a "User N:" line so other text never starts a user match
+    r"^[ \t]*User (?P<user>\d+): [^\n]*?\benabled=(?P<enabled>\d+)"
+    # Version code of the package
+    r"|versionCode=(?P<version>\d+)"
+    # App label can appear as: applicationInfo=... labelRes=... nonLocalizedLabel=...
+    # Resource IDs (0x...) and unset labels (null) are skipped; quotes are left out of the capture
+    r'|(?:nonLocalizedLabel|labelRes)=(?!0x|null\b)"?(?P<label>[^"\s]+)',
+    re.M,
+)
+# parse_dumpsys_package field bits
+_FOUND_ENABLED = 1
+_FOUND_VERSION = 2
+_FOUND_LABEL = 4
+_FOUND_ALL = _FOUND_ENABLED | _FOUND_VERSION | _FOUND_LABEL
+
+_STATE_MAP = {
+    "device": DeviceState.DEVICE,
+    "offline": DeviceState.OFFLINE,
+    "unauthorized": DeviceState.UNAUTHORIZED,
+    "bootloader": DeviceState.BOOTLOADER,
+    "recovery": DeviceState.RECOVERY,
+    "sideload": DeviceState.SIDELOAD,
+}
+_SIZE_MULTIPLIERS = {"K": 0.001, "M": 1.0, "G": 1024.0, "T": 1024.0 * 1024.0}
+
 
 def parse_device_state(state_str: str) -> DeviceState:
     """Parse device state string to enum."""
-    state_map = {
-        "device": DeviceState.DEVICE,
-        "offline": DeviceState.OFFLINE,
-        "unauthorized": DeviceState.UNAUTHORIZED,
-        "bootloader": DeviceState.BOOTLOADER,
-        "recovery": DeviceState.RECOVERY,
-        "sideload": DeviceState.SIDELOAD,
-    }
-    return state_map.get(state_str.lower(), DeviceState.UNKNOWN)
+    # adb prints states in lowercase, so only lowercase on a miss
+    return _STATE_MAP.get(state_str) or _STATE_MAP.get(state_str.lower(), DeviceState.UNKNOWN)
 
 
 def parse_devices_output(output: str) -> list[tuple[str, DeviceState, dict[str, str]]]:
@@ -23,16 +49,17 @@ def parse_devices_output(output: str) -> list[tuple[str, DeviceState, dict[str,
     Parse 'adb devices -l' output.
     Returns list of (device_id, state, properties).
     """
-    devices: list[tuple[str, DeviceState, dict[str, str]]] = []
+    # Common polling case: nothing connected, so only the header (if anything) is printed
+    stripped = output.strip()
+    if not stripped or stripped == _DEVICES_HEADER:
+        return []
 
-    for line in output.strip().splitlines():
-        line = line.strip()
-        # Skip header and empty lines
-        if not line or line.startswith("List of devices"):
-            continue
+    devices: list[tuple[str, DeviceState, dict[str, str]]] = []
 
+    for line in stripped.splitlines():
+        # split() drops surrounding whitespace; skip blank, short and header lines
         parts = line.split()
-        if len(parts) < 2:
+        if len(parts) < 2 or parts[0] == "List":
             continue
 
         device_id = parts[0]
@@ -41,8 +68,8 @@ def parse_devices_output(output: str) -> list[tuple[str, DeviceState, dict[str,
         # Parse additional properties (key:value pairs)
         props: dict[str, str] = {}
         for part in parts[2:]:
-            if ":" in part:
-                key, value = part.split(":", 1)
+            key, sep, value = part.partition(":")
+            if sep:
                 props[key] = value
 
         devices.append((device_id, state, props))
@@ -55,31 +82,28 @@ def parse_users_output(output: str) -> list[int]:
     Parse 'pm list users' output.
     Returns list of user IDs.
     """
-    users: list[int] = []
-    # Pattern: UserInfo{0:Owner:flags}
-    pattern = re.compile(r"UserInfo\{(\d+):")
+    return [int(user_id) for user_id in _USER_RE.findall(output)]
 
-    for line in output.strip().splitlines():
-        match = pattern.search(line)
-        if match:
-            users.append(int(match.group(1)))
 
-    return users
+def parse_getprop_output(output: str) -> dict[str, str]:
+    """
+    Parse bare 'getprop' output (all properties).
+    Returns dict mapping property name to value.
+    """
+    return dict(_GETPROP_RE.findall(output))
 
 
 def parse_packages_output(output: str) -> list[str]:
     """
     Parse 'pm list packages' output.
-    Returns list of package names.
+    Returns list of unique package names in output order.
     """
-    packages: list[str] = []
-
-    for line in output.strip().splitlines():
-        line = line.strip()
-        if line.startswith("package:"):
-            packages.append(line[8:])  # Remove 'package:' prefix
-
-    return packages
+    packages = [
+        line[8:]  # Remove 'package:' prefix
+        for line in map(str.strip, output.splitlines())
+        if line.startswith("package:")
+    ]
+    return list(dict.fromkeys(packages))
 
 
 def parse_package_path(output: str) -> str | None:
@@ -87,7 +111,7 @@ def parse_package_path(output: str) -> str | None:
     Parse 'pm path' output to get the base APK path.
     Returns the directory containing the APK.
     """
-    for line in output.strip().splitlines():
+    for line in output.splitlines():
         line = line.strip()
         if line.startswith("package:") and "base.apk" in line:
             path = line[8:]  # Remove 'package:' prefix
@@ -108,33 +132,27 @@ def parse_dumpsys_package(output: str, user_id: int = 0) -> dict[str, str | int
         "app_label": "",
     }
 
-    # Look for user-specific state (e.g., "User 0: ... enabled=0")
-    user_pattern = re.compile(rf"User {user_id}:.*?enabled=(\d+)")
-    version_pattern = re.compile(r"versionCode=(\d+)")
-    # App label can appear as: applicationInfo=... labelRes=... nonLocalizedLabel=...
-    # or in ApplicationInfo section
-    label_pattern = re.compile(r"(?:nonLocalizedLabel|labelRes)=([^\s]+)")
-
-    for line in output.splitlines():
-        # Check for enabled state
-        user_match = user_pattern.search(line)
-        if user_match:
-            # enabled=0 means ENABLED, enabled=2 means DISABLED_USER, enabled=3 means DEFAULT
-            enabled_value = int(user_match.group(1))
-            result["enabled"] = enabled_value in (0, 1)  # 0 and 1 are enabled states
-
-        # Check for version code
-        version_match = version_pattern.search(line)
-        if version_match:
-            result["version_code"] = int(version_match.group(1))
-
-        # Check for app label
-        label_match = label_pattern.search(line)
-        if label_match and not result["app_label"]:
-            label = label_match.group(1).strip()
-            # Remove quotes and resource IDs
-            if label and not label.startswith("0x"):
-                result["app_label"] = label.strip('"')
+    # The first occurrence of each field belongs to the installed package; later
+    # sections (e.g. "Hidden system packages") describe older copies
+    found = 0
+    for match in _DUMPSYS_RE.finditer(output):
+        kind = match.lastgroup
+        if kind == "enabled":
+            # Check for enabled state of the requested user
+            if not found & _FOUND_ENABLED and int(match["user"]) == user_id:
+                # enabled=0 means ENABLED, enabled=2 means DISABLED_USER, enabled=3 means DEFAULT
+                result["enabled"] = int(match["enabled"]) in (0, 1)  # 0 and 1 are enabled states
+                found |= _FOUND_ENABLED
+        elif kind == "version":
+            if not found & _FOUND_VERSION:
+                result["version_code"] = int(match["version"])
+                found |= _FOUND_VERSION
+        elif kind == "label" and not found & _FOUND_LABEL:
+            result["app_label"] = match["label"]
+            found |= _FOUND_LABEL
+
+        if found == _FOUND_ALL:
+            break
 
     return result
 
@@ -144,20 +162,23 @@ def parse_du_output(output: str) -> float:
     Parse 'du -sh' output to extract size in MB.
     Returns size in MB.
     """
-    line = output.strip().split("\n")[0] if output.strip() else ""
-    parts = line.split()
-    if len(parts) < 1:
+    # The size is the first token of the first non-blank line
+    parts = output.split(None, 1)
+    if not parts:
         return 0.0
 
     size_str = parts[0]
-    # Parse size with unit (e.g., "25M", "1.5G", "512K")
-    match = re.match(r"([\d.]+)([KMGT])?", size_str)
-    if not match:
+    # Split size and unit (e.g., "25M", "1.5G", "512K"); no unit means kilobytes
+    unit = size_str[-1]
+    if unit in _SIZE_MULTIPLIERS:
+        size_str = size_str[:-1]
+    else:
+        unit = "K"
+
+    try:
+        value = float(size_str)
+    except ValueError:
         return 0.0
 
-    value = float(match.group(1))
-    unit = match.group(2) or "K"
-
     # Convert to MB
-    multipliers = {"K": 0.001, "M": 1.0, "G": 1024.0, "T": 1024.0 * 1024.0}
-    return round(value * multipliers.get(unit, 1.0), 2)
+    return round(value * _SIZE_MULTIPLIERS[unit], 2)
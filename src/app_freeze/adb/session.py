@@ -0,0 +1,129 @@
+"""Persistent adb shell sessions for running many commands over one connection."""
+
+import asyncio
+from typing import Final
+
+from app_freeze.adb.errors import ADBCommandError, ADBDeviceDisconnectedError, ADBTimeoutError
+
+OUTPUT_ENCODING: Final[str] = "utf-8"
+# Printed after each command as "\n<marker><exit code>\n"
+END_MARKER: Final[bytes] = b"__APPFREEZE_END__"
+# Max bytes buffered for one command's output (dumpsys can exceed the 64 KiB default)
+STREAM_LIMIT: Final[int] = 32 * 1024 * 1024
+
+
+class ShellSession:
+    """
+    A long-lived shell process (typically 'adb -s <id> shell') that runs commands
+    one at a time, delimited by an end marker carrying the exit code.
+
+    The process is started lazily and restarted if it dies or a command times out.
+    """
+
+    def __init__(self, cmd: list[str], device_id: str = "unknown") -> None:
+        """
+        Initialize a shell session.
+
+        Args:
+            cmd: Command that starts the shell, e.g. [adb, "-s", device_id, "shell"].
+            device_id: Device ID used in error messages.
+        """
+        self._cmd = cmd
+        self._device_id = device_id
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ShellSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def run(self, command: str, timeout: float) -> str:
+        """
+        Run a shell command in the session.
+
+        Args:
+            command: Shell command line (may contain ';'-separated statements).
+            timeout: Timeout in seconds for this command.
+
+        Returns:
+            Command stdout.
+
+        Raises:
+            ADBTimeoutError: If the command times out (the session is restarted on next use).
+            ADBCommandError: If the command exits with a non-zero status.
+            ADBDeviceDisconnectedError: If the shell process exits unexpectedly.
+        """
+        async with self._lock:
+            stdin, stdout = await self._ensure_started()
+
+            # Braces keep multi-statement commands together; stdin is detached so
+            # commands cannot swallow the rest of the session input
+            script = f"{{ {command}\n}} </dev/null; printf '\\n%s%d\\n' {END_MARKER.decode()} $?\n"
+            try:
+                stdin.write(script.encode(OUTPUT_ENCODING))
+                await stdin.drain()
+                output, exit_code = await asyncio.wait_for(self._read_result(stdout), timeout)
+            except TimeoutError as e:
+                await self._kill()
+                raise ADBTimeoutError(command, timeout) from e
+            except asyncio.LimitOverrunError as e:
+                await self._kill()
+                raise ADBCommandError(command, -1, "output exceeds session buffer") from e
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                await self._kill()
+                raise ADBDeviceDisconnectedError(self._device_id) from e
+
+        text = output.decode(OUTPUT_ENCODING, "replace")
+        if exit_code != 0:
+            raise ADBCommandError(command, exit_code, text)
+        return text
+
+    async def close(self) -> None:
+        """Terminate the shell process."""
+        async with self._lock:
+            proc = self._proc
+            self._proc = None
+            if proc is None or proc.returncode is not None:
+                return
+            if proc.stdin is not None:
+                proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), 1.0)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+
+    async def _ensure_started(self) -> tuple[asyncio.StreamWriter, asyncio.StreamReader]:
+        """Start the shell process if it is not running. Returns its (stdin, stdout)."""
+        if self._proc is None or self._proc.returncode is not None:
+            self._proc = await asyncio.create_subprocess_exec(
+                *self._cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=STREAM_LIMIT,
+            )
+        if self._proc.stdin is None or self._proc.stdout is None:
+            raise ADBDeviceDisconnectedError(self._device_id)
+        return self._proc.stdin, self._proc.stdout
+
+    async def _kill(self) -> None:
+        """Kill the shell process after a failure."""
+        proc = self._proc
+        self._proc = None
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    @staticmethod
+    async def _read_result(stdout: asyncio.StreamReader) -> tuple[bytes, int]:
+        """Read output up to the end marker. Returns (output, exit_code)."""
+        data = await stdout.readuntil(END_MARKER)
+        code_line = await stdout.readline()
+        # Drop the marker and the newline printed before it
+        output = data[: -len(END_MARKER)]
+        if output.endswith(b"\n"):
+            output = output[:-1]
+        return output, int(code_line.strip() or b"0")
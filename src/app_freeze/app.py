@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 import threading
-from dataclasses import dataclass, field
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum, auto
+from itertools import filterfalse, islice
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from prompt_toolkit import Application
@@ -30,8 +36,13 @@ from app_freeze.state import AppAction
 if TYPE_CHECKING:
     pass
 
+# Minimum seconds between progress-driven redraws (~30 Hz)
+REDRAW_INTERVAL = 1 / 30
+
 # Type alias for styled text fragments
 StyleAndText = list[tuple[str, str]]
+# Cached app row pieces: (status, system marker or None, name_text, package, size_text)
+AppRow = tuple[tuple[str, str], tuple[str, str] | None, str, tuple[str, str], str]
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Styles - Catppuccin Mocha palette
@@ -98,18 +109,43 @@ class FilterMode(Enum):
     DISABLED = auto()
 
 
+_GET_PACKAGE = attrgetter("package_name")
+
+# Tab key -> filter mode
+TAB_KEYS: dict[str, FilterMode] = {
+    "1": FilterMode.ALL,
+    "2": FilterMode.USER,
+    "3": FilterMode.SYSTEM,
+    "4": FilterMode.ENABLED,
+    "5": FilterMode.DISABLED,
+}
+
+_GET_ENABLED = attrgetter("is_enabled")
+_GET_SYSTEM = attrgetter("is_system")
+
+# Per-tab (flag getter, wanted value); None means no mode filtering
+_MODE_FILTERS: dict[FilterMode, tuple[Callable[[AppInfo], bool], bool] | None] = {
+    FilterMode.ALL: None,
+    FilterMode.USER: (_GET_SYSTEM, False),
+    FilterMode.SYSTEM: (_GET_SYSTEM, True),
+    FilterMode.ENABLED: (_GET_ENABLED, True),
+    FilterMode.DISABLED: (_GET_ENABLED, False),
+}
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # State
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class UIState:
     """Mutable UI state for the application."""
 
     view: ViewState = ViewState.LOADING
     error_msg: str = ""
     loading_status: str = ""  # Status message during loading
+    refreshing_apps: bool = False  # App details are loading behind the shown list
 
     # Device selection
     devices: list[DeviceInfo] = field(default_factory=list)
@@ -132,41 +168,103 @@ class UIState:
     execution_current: str = ""  # Current package being processed
     execution_results: list[tuple[str, bool, str | None]] = field(default_factory=list)
 
+    # Bumped whenever entries of `apps` change in place; part of the filter cache key
+    apps_version: int = 0
+    _filter_cache: list[AppInfo] = field(default_factory=list, repr=False)
+    _filter_cache_key: tuple[object, ...] | None = field(default=None, repr=False)
+    # Lowercased package names parallel to `apps`, for the text filter
+    _names_lower: list[str] = field(default_factory=list, repr=False)
+    _names_lower_key: tuple[object, ...] | None = field(default=None, repr=False)
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+    _positions_key: tuple[object, ...] | None = field(default=None, repr=False)
+    _stats: dict[str, int] = field(default_factory=dict, repr=False)
+    _stats_key: tuple[object, ...] | None = field(default=None, repr=False)
+    # package name -> (AppInfo the row was built from, row fragments)
+    row_cache: dict[str, tuple[AppInfo, AppRow]] = field(default_factory=dict, repr=False)
+
+    def mark_apps_changed(self) -> None:
+        """Invalidate derived app data after `apps` is modified."""
+        self.apps_version += 1
+        # Rows are rebuilt lazily for the visible window only, so dropping them is cheap
+        self.row_cache.clear()
+
     def filtered_apps(self) -> list[AppInfo]:
-        """Get apps matching current filter."""
+        """Get apps matching current filter (cached until apps or filter change)."""
+        # One read of `apps`: a worker thread may swap the list mid-render
         apps = self.apps
-
-        # Text filter
-        if self.filter_text:
-            q = self.filter_text.lower()
-            apps = [a for a in apps if q in a.package_name.lower()]
-
-        # Mode filter
-        if self.filter_mode == FilterMode.ENABLED:
-            apps = [a for a in apps if a.is_enabled]
-        elif self.filter_mode == FilterMode.DISABLED:
-            apps = [a for a in apps if not a.is_enabled]
-        elif self.filter_mode == FilterMode.USER:
-            apps = [a for a in apps if not a.is_system]
-        elif self.filter_mode == FilterMode.SYSTEM:
-            apps = [a for a in apps if a.is_system]
-
-        return apps
+        key = (id(apps), len(apps), self.apps_version, self.filter_text, self.filter_mode)
+        if key != self._filter_cache_key:
+            self._filter_cache = self._compute_filtered_apps(apps)
+            self._filter_cache_key = key
+        return self._filter_cache
+
+    def filtered_len(self) -> int:
+        """Number of apps matching the current filter."""
+        return len(self.filtered_apps())
+
+    def filtered_at(self, index: int) -> AppInfo | None:
+        """App at a position in the filtered list, or None if out of range."""
+        filtered = self.filtered_apps()
+        return filtered[index] if 0 <= index < len(filtered) else None
+
+    def _compute_filtered_apps(self, apps: list[AppInfo]) -> list[AppInfo]:
+        """Apply the text and mode filters to `apps` in a single pass."""
+        # Space-separated terms must all match
+        terms = self.filter_text.lower().split()
+        mode_filter = _MODE_FILTERS[self.filter_mode]
+
+        if not terms:
+            if mode_filter is None:
+                return list(apps)
+            get_flag, wanted = mode_filter
+            # filter/filterfalse keep the per-app loop in C
+            return list((filter if wanted else filterfalse)(get_flag, apps))
+
+        pairs = zip(apps, self._lowered_names(apps), strict=True)
+        if len(terms) == 1:
+            # Common case: a single substring test per name
+            q = terms[0]
+            text_matches = (a for a, name in pairs if q in name)
+        else:
+            text_matches = (a for a, name in pairs if all(t in name for t in terms))
+        if mode_filter is None:
+            return list(text_matches)
+        get_flag, wanted = mode_filter
+        return [a for a in text_matches if get_flag(a) == wanted]
+
+    def _lowered_names(self, apps: list[AppInfo]) -> list[str]:
+        """Lowercased package names of `apps`, computed once per apps change."""
+        key = (id(apps), len(apps), self.apps_version)
+        if key != self._names_lower_key:
+            self._names_lower = [a.package_name.lower() for a in apps]
+            self._names_lower_key = key
+        return self._names_lower
+
+    def app_positions(self) -> dict[str, int]:
+        """Index of each package in `apps` (rebuilt only when apps change)."""
+        key = (id(self.apps), len(self.apps), self.apps_version)
+        if key != self._positions_key:
+            self._positions = {a.package_name: i for i, a in enumerate(self.apps)}
+            self._positions_key = key
+        return self._positions
 
     def get_stats(self) -> dict[str, int]:
-        """Get app statistics."""
-        total = len(self.apps)
-        system = sum(1 for a in self.apps if a.is_system)
-        user = total - system
-        enabled = sum(1 for a in self.apps if a.is_enabled)
-        disabled = total - enabled
-        return {
-            "total": total,
-            "system": system,
-            "user": user,
-            "enabled": enabled,
-            "disabled": disabled,
-        }
+        """Get app statistics (recounted only when apps change)."""
+        key = (id(self.apps), len(self.apps), self.apps_version)
+        if key != self._stats_key:
+            total = len(self.apps)
+            # bools sum as 0/1; map() with attrgetter keeps the count loop in C
+            system = sum(map(_GET_SYSTEM, self.apps))
+            enabled = sum(map(_GET_ENABLED, self.apps))
+            self._stats = {
+                "total": total,
+                "system": system,
+                "user": total - system,
+                "enabled": enabled,
+                "disabled": total - enabled,
+            }
+            self._stats_key = key
+        return dict(self._stats)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -277,19 +375,63 @@ def render_device_list(state: UIState) -> StyleAndText:
     return result
 
 
+_FRAG_DIVIDER = ("", " " + "─" * 72 + "\n")
+
+# App row style and prefix by (is_cursor << 1 | is_selected)
+_ROW_STYLES = ("", "class:list.selected", "class:list.cursor", "class:list.cursor")
+_ROW_PREFIXES = ("    ", "  ● ", " ❯  ", " ❯● ")
+
+# Shared immutable row fragments
+_FRAG_ENABLED = ("class:app.enabled", "✓")
+_FRAG_DISABLED = ("class:app.disabled", "✗")
+_FRAG_SYSTEM = ("class:app.system", " [S]")
+_FRAG_NEWLINE = ("", "\n")
+
+
+def _app_row(state: UIState, app: AppInfo) -> AppRow:
+    """Get the selection-independent fragments of an app row, cached per AppInfo."""
+    cached = state.row_cache.get(app.package_name)
+    if cached is not None and cached[0] is app:
+        return cached[1]
+
+    # Status indicator
+    status = _FRAG_ENABLED if app.is_enabled else _FRAG_DISABLED
+
+    # System marker gets its own fragment; otherwise its blank is merged into the name text
+    sys_fragment, sys_blank = (_FRAG_SYSTEM, "") if app.is_system else (None, "    ")
+
+    # Size
+    size_str = f"{app.size_mb:>6.1f}MB" if app.size_mb > 0 else "      -"
+
+    # App name and package name
+    app_name = app.display_name[:25].ljust(25)  # Display name from package
+    pkg_name = app.package_name[:45]  # Package name
+
+    row: AppRow = (
+        status,
+        sys_fragment,
+        f"{sys_blank} {app_name} ",
+        ("class:summary", pkg_name),
+        f" {size_str}\n",
+    )
+    state.row_cache[app.package_name] = (app, row)
+    return row
+
+
 def render_app_list(state: UIState, height: int = 20) -> StyleAndText:
     """Render app list with cursor and selection."""
     result: StyleAndText = []
     filtered = state.filtered_apps()
+    count = len(filtered)
 
     # Show current filter and count
     mode_str = state.filter_mode.name.lower()
     result.append(("class:summary", f" Showing: {mode_str} "))
-    result.append(("class:summary.count", f"({len(filtered)} apps)"))
+    result.append(("class:summary.count", f"({count} apps)"))
     if state.filter_text:
         result.append(("class:filter.label", f" filter: '{state.filter_text}'"))
     result.append(("", "\n"))
-    result.append(("", " " + "─" * 72 + "\n"))
+    result.append(_FRAG_DIVIDER)
 
     if not filtered:
         result.append(("", "\n  No apps match filter.\n"))
@@ -302,84 +444,64 @@ def render_app_list(state: UIState, height: int = 20) -> StyleAndText:
 
     # Keep cursor in view with some padding at bottom
     padding = 7  # Empty lines to show when at end
-    if state.app_cursor >= len(filtered) - padding:
+    if state.app_cursor >= count - padding:
         # Near end: show last items with padding
-        start = max(0, len(filtered) - visible + padding)
-        end = len(filtered)
+        start = max(0, count - visible + padding)
+        end = count
     else:
         # Normal scrolling: center cursor
         start = max(0, state.app_cursor - visible // 2)
-        end = min(len(filtered), start + visible)
+        end = min(count, start + visible)
         start = max(0, end - visible)
 
     if start > 0:
         result.append(("class:summary", f" ↑ {start} more above\n"))
 
-    for i in range(start, end):
-        app = filtered[i]
-        is_cursor = i == state.app_cursor
-        is_selected = app.package_name in state.selected_packages
-
-        # Prefix: cursor and selection markers
-        if is_cursor and is_selected:
-            prefix = "❯●"
-        elif is_cursor:
-            prefix = "❯ "
-        elif is_selected:
-            prefix = " ●"
-        else:
-            prefix = "  "
-
-        # Status indicator
-        state_style = "class:app.enabled" if app.is_enabled else "class:app.disabled"
-        state_char = "✓" if app.is_enabled else "✗"
-
-        # System marker
-        sys_marker = (" [S]", "class:app.system") if app.is_system else ("    ", "")
-
-        # Size
-        size_str = f"{app.size_mb:>6.1f}MB" if app.size_mb > 0 else "      -"
-
-        # App name and package name
-        app_name = app.display_name[:25].ljust(25)  # Display name from package
-        pkg_name = app.package_name[:45]  # Package name
-
-        # Row style
-        if is_cursor:
-            row_style = "class:list.cursor"
-        elif is_selected:
-            row_style = "class:list.selected"
-        else:
-            row_style = ""
-
-        result.append((row_style, f" {prefix} "))
-        result.append((state_style, state_char))
-        result.append((sys_marker[1] if sys_marker[1] else row_style, sys_marker[0]))
-        result.append((row_style, f" {app_name} "))
-        result.append(("class:summary", f"{pkg_name}"))
-        result.append((row_style, f" {size_str}\n"))
+    # Only the visible window is touched, however long the filtered list is
+    cursor = state.app_cursor
+    selected = state.selected_packages
+    for i, app in enumerate(islice(filtered, start, end), start):
+        # Row style and cursor/selection markers, indexed by (is_cursor, is_selected) bits
+        row_kind = (i == cursor) << 1 | (app.package_name in selected)
+        row_style = _ROW_STYLES[row_kind]
+
+        status, sys_fragment, name_text, pkg_fragment, size_text = _app_row(state, app)
+        result.append((row_style, _ROW_PREFIXES[row_kind]))
+        result.append(status)
+        if sys_fragment is not None:
+            result.append(sys_fragment)
+        result.append((row_style, name_text))
+        result.append(pkg_fragment)
+        result.append((row_style, size_text))
 
     # Show empty lines at end to indicate list completion
-    if end >= len(filtered):
-        for _ in range(padding):
-            result.append(("", "\n"))
+    if end >= count:
+        result.extend([_FRAG_NEWLINE] * padding)
     else:
-        remaining = len(filtered) - end
+        remaining = count - end
         result.append(("class:summary", f" ↓ {remaining} more below\n"))
 
     return result
 
 
+# Action -> (confirm prompt, in-progress, done) labels; no pending action reads as enable
+_ACTION_LABELS: dict[AppAction | None, tuple[str, str, str]] = {
+    AppAction.DISABLE: ("DISABLE", "Disabling", "Disabled"),
+    AppAction.ENABLE: ("ENABLE", "Enabling", "Enabled"),
+    None: ("ENABLE", "Enabling", "Enabled"),
+}
+
+
 def render_confirm(state: UIState) -> StyleAndText:
     """Render confirmation dialog inline."""
     result: StyleAndText = [("", "\n")]
-    action = "DISABLE" if state.pending_action == AppAction.DISABLE else "ENABLE"
+    action = _ACTION_LABELS[state.pending_action][0]
     count = len(state.selected_packages)
 
     result.append(("class:confirm", f"  {action} {count} app(s)?\n\n"))
 
     # List affected packages
-    for pkg in sorted(state.selected_packages)[:10]:
+    for pkg in heapq.nsmallest(10, state.selected_packages):
         result.append(("", f"    • {pkg}\n"))
     if count > 10:
         result.append(("class:summary", f"    ... and {count - 10} more\n"))
@@ -394,17 +516,23 @@ def render_confirm(state: UIState) -> StyleAndText:
     return result
 
 
+# Progress bar strings indexed by filled cells
+PROGRESS_BAR_WIDTH = 40
+_PROGRESS_BARS = tuple(
+    "█" * filled + "░" * (PROGRESS_BAR_WIDTH - filled) for filled in range(PROGRESS_BAR_WIDTH + 1)
+)
+
+
 def render_execution(state: UIState) -> StyleAndText:
     """Render execution progress."""
     result: StyleAndText = [("", "\n")]
-    action = "Disabling" if state.pending_action == AppAction.DISABLE else "Enabling"
+    action = _ACTION_LABELS[state.pending_action][1]
     progress = state.execution_progress
     total = state.execution_total
 
     # Progress bar
-    bar_width = 40
-    filled = int(bar_width * progress / total) if total > 0 else 0
-    bar = "█" * filled + "░" * (bar_width - filled)
+    filled = int(PROGRESS_BAR_WIDTH * progress / total) if total > 0 else 0
+    bar = _PROGRESS_BARS[min(filled, PROGRESS_BAR_WIDTH)]
 
     result.append(("class:progress", f"  {action} apps...\n\n"))
     result.append(("class:progress", f"  [{bar}] {progress}/{total}\n"))
@@ -429,7 +557,7 @@ def render_execution(state: UIState) -> StyleAndText:
 def render_result(state: UIState) -> StyleAndText:
     """Render result log after action completion."""
     result: StyleAndText = [("", "\n")]
-    action = "Disabled" if state.pending_action == AppAction.DISABLE else "Enabled"
+    action = _ACTION_LABELS[state.pending_action][2]
 
     # Count results
     success_count = sum(1 for _, s, _ in state.execution_results if s)
@@ -470,53 +598,57 @@ def render_error(state: UIState) -> StyleAndText:
     ]
 
 
-def render_footer(state: UIState) -> StyleAndText:
-    """Render context-sensitive footer keybindings."""
-    if state.view == ViewState.CONFIRM:
-        return [
-            ("class:footer.key", " [y]"),
-            ("class:footer.desc", "confirm "),
-            ("class:footer.key", "[q]"),
-            ("class:footer.desc", "cancel "),
-        ]
+# Static footer fragments per view; only the app list's selection count varies
+_FOOTER_CONFIRM: tuple[tuple[str, str], ...] = (
+    ("class:footer.key", " [y]"),
+    ("class:footer.desc", "confirm "),
+    ("class:footer.key", "[q]"),
+    ("class:footer.desc", "cancel "),
+)
+_FOOTER_RESULT: tuple[tuple[str, str], ...] = (
+    ("class:footer.key", " [enter/q]"),
+    ("class:footer.desc", "continue "),
+)
+_FOOTER_DEVICE_SELECT: tuple[tuple[str, str], ...] = (
+    ("class:footer.key", " [j/k]"),
+    ("class:footer.desc", "navigate "),
+    ("class:footer.key", "[enter]"),
+    ("class:footer.desc", "select "),
+    ("class:footer.key", "[q]"),
+    ("class:footer.desc", "quit "),
+)
+_FOOTER_APP_LIST: tuple[tuple[str, str], ...] = (
+    ("class:footer.key", " [j/k]"),
+    ("class:footer.desc", "nav "),
+    ("class:footer.key", "[space]"),
+    ("class:footer.desc", "sel "),
+    ("class:footer.key", "[/]"),
+    ("class:footer.desc", "search "),
+    ("class:footer.key", "[1-5]"),
+    ("class:footer.desc", "tabs "),
+    ("class:footer.key", "[D]"),
+    ("class:footer.desc", "disable "),
+    ("class:footer.key", "[E]"),
+    ("class:footer.desc", "enable "),
+    ("class:footer.key", "[q]"),
+    ("class:footer.desc", "quit "),
+)
+_FOOTER_DEFAULT: tuple[tuple[str, str], ...] = (("class:footer", " Press q to quit"),)
 
-    if state.view == ViewState.RESULT:
-        return [
-            ("class:footer.key", " [enter/q]"),
-            ("class:footer.desc", "continue "),
-        ]
 
-    if state.view == ViewState.DEVICE_SELECT:
-        return [
-            ("class:footer.key", " [j/k]"),
-            ("class:footer.desc", "navigate "),
-            ("class:footer.key", "[enter]"),
-            ("class:footer.desc", "select "),
-            ("class:footer.key", "[q]"),
-            ("class:footer.desc", "quit "),
-        ]
+_STATIC_FOOTERS: dict[ViewState, tuple[tuple[str, str], ...]] = {
+    ViewState.CONFIRM: _FOOTER_CONFIRM,
+    ViewState.RESULT: _FOOTER_RESULT,
+    ViewState.DEVICE_SELECT: _FOOTER_DEVICE_SELECT,
+}
 
+
+def render_footer(state: UIState) -> StyleAndText:
+    """Render context-sensitive footer keybindings."""
     if state.view == ViewState.APP_LIST:
         selected = len(state.selected_packages)
-        return [
-            ("class:footer.key", " [j/k]"),
-            ("class:footer.desc", "nav "),
-            ("class:footer.key", "[space]"),
-            ("class:footer.desc", "sel "),
-            ("class:footer.key", "[/]"),
-            ("class:footer.desc", "search "),
-            ("class:footer.key", "[1-5]"),
-            ("class:footer.desc", "tabs "),
-            ("class:footer.key", "[D]"),
-            ("class:footer.desc", "disable "),
-            ("class:footer.key", "[E]"),
-            ("class:footer.desc", "enable "),
-            ("class:footer.key", "[q]"),
-            ("class:footer.desc", "quit "),
-            ("class:summary.count", f"│ {selected} sel"),
-        ]
-
-    return [("class:footer", " Press q to quit")]
+        return [*_FOOTER_APP_LIST, ("class:summary.count", f"│ {selected} sel")]
+    return list(_STATIC_FOOTERS.get(state.view, _FOOTER_DEFAULT))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -535,6 +667,28 @@ class AppFreezeUI:
         # Filter input buffer - control visibility via state
         self.filter_buffer = Buffer(on_text_changed=self._on_filter_changed)
         self.filter_visible = False
+        # monotonic time of the last throttled redraw
+        self._last_invalidate = 0.0
+        # Set while a coalesced redraw is scheduled; guarded by _paint_lock
+        self._paint_pending = False
+        self._paint_lock = threading.Lock()
+        # Guards swapping in refreshed apps against _reload_apps patching them
+        self._apps_lock = threading.Lock()
+        # package -> enabled state set by actions since the current detail load started
+        self._acted_states: dict[str, bool] = {}
+        # Bar renderer name -> (inputs it was rendered from, fragments)
+        self._render_cache: dict[str, tuple[object, StyleAndText]] = {}
+
+        # View -> main content renderer
+        self._content_renderers: dict[ViewState, Callable[[], StyleAndText]] = {
+            ViewState.LOADING: self._render_loading,
+            ViewState.ERROR: lambda: render_error(self.state),
+            ViewState.DEVICE_SELECT: lambda: render_device_list(self.state),
+            ViewState.CONFIRM: lambda: render_confirm(self.state),
+            ViewState.EXECUTING: lambda: render_execution(self.state),
+            ViewState.RESULT: lambda: render_result(self.state),
+            ViewState.APP_LIST: self._render_app_list,
+        }
 
         self.kb = self._create_keybindings()
         self.app: Application[None] = Application(
@@ -549,11 +703,8 @@ class AppFreezeUI:
         """Update filter text from buffer."""
         self.state.filter_text = buf.text
         # Clamp cursor to valid range after filter change
-        filtered = self.state.filtered_apps()
-        if filtered:
-            self.state.app_cursor = min(self.state.app_cursor, len(filtered) - 1)
-        else:
-            self.state.app_cursor = 0
+        count = self.state.filtered_len()
+        self.state.app_cursor = min(self.state.app_cursor, count - 1) if count else 0
 
     def _create_keybindings(self) -> KeyBindings:
         """Create all keybindings."""
@@ -586,10 +737,9 @@ class AppFreezeUI:
                     len(self.state.devices) - 1,
                 )
             elif self.state.view == ViewState.APP_LIST:
-                filtered = self.state.filtered_apps()
                 self.state.app_cursor = min(
                     self.state.app_cursor + 1,
-                    max(0, len(filtered) - 1),
+                    max(0, self.state.filtered_len() - 1),
                 )
 
         @kb.add("k")
@@ -616,8 +766,7 @@ class AppFreezeUI:
             if self.state.view == ViewState.DEVICE_SELECT:
                 self.state.device_cursor = max(0, len(self.state.devices) - 1)
             elif self.state.view == ViewState.APP_LIST:
-                filtered = self.state.filtered_apps()
-                self.state.app_cursor = max(0, len(filtered) - 1)
+                self.state.app_cursor = max(0, self.state.filtered_len() - 1)
 
         # ─── Selection ─────────────────────────────────────────────────────
         @kb.add("enter")
@@ -625,7 +774,10 @@ class AppFreezeUI:
             if self.filter_visible:
                 self._close_filter()
             elif self.state.view == ViewState.DEVICE_SELECT and self.state.devices:
-                self._select_device(self.state.devices[self.state.device_cursor])
+                # Load apps in background thread so the UI keeps drawing progress
+                device = self.state.devices[self.state.device_cursor]
+                self.state.view = ViewState.LOADING  # Ignore repeated enter presses
+                threading.Thread(target=self._select_device, args=(device,), daemon=True).start()
             elif self.state.view == ViewState.RESULT:
                 self.state.view = ViewState.APP_LIST
                 self.state.pending_action = None
@@ -634,10 +786,10 @@ class AppFreezeUI:
         def toggle_selection(event: KeyPressEvent) -> None:
             if self.state.view != ViewState.APP_LIST or self.filter_visible:
                 return
-            filtered = self.state.filtered_apps()
-            if not filtered:
+            app = self.state.filtered_at(self.state.app_cursor)
+            if app is None:
                 return
-            pkg = filtered[self.state.app_cursor].package_name
+            pkg = app.package_name
             if pkg in self.state.selected_packages:
                 self.state.selected_packages.discard(pkg)
             else:
@@ -647,8 +799,7 @@ class AppFreezeUI:
         def select_all(event: KeyPressEvent) -> None:
             if self.state.view != ViewState.APP_LIST or self.filter_visible:
                 return
-            for app in self.state.filtered_apps():
-                self.state.selected_packages.add(app.package_name)
+            self.state.selected_packages.update(map(_GET_PACKAGE, self.state.filtered_apps()))
 
         @kb.add("n")
         def select_none(event: KeyPressEvent) -> None:
@@ -671,35 +822,16 @@ class AppFreezeUI:
                 self._close_filter()
 
         # ─── Tab Filters (1-5) ─────────────────────────────────────────────
-        @kb.add("1")
-        def tab_all(event: KeyPressEvent) -> None:
-            if self.state.view == ViewState.APP_LIST and not self.filter_visible:
-                self.state.filter_mode = FilterMode.ALL
-                self.state.app_cursor = 0
+        def make_tab_handler(mode: FilterMode) -> Callable[[KeyPressEvent], None]:
+            def switch_tab(event: KeyPressEvent) -> None:
+                if self.state.view == ViewState.APP_LIST and not self.filter_visible:
+                    self.state.filter_mode = mode
+                    self.state.app_cursor = 0
 
-        @kb.add("2")
-        def tab_user(event: KeyPressEvent) -> None:
-            if self.state.view == ViewState.APP_LIST and not self.filter_visible:
-                self.state.filter_mode = FilterMode.USER
-                self.state.app_cursor = 0
+            return switch_tab
 
-        @kb.add("3")
-        def tab_system(event: KeyPressEvent) -> None:
-            if self.state.view == ViewState.APP_LIST and not self.filter_visible:
-                self.state.filter_mode = FilterMode.SYSTEM
-                self.state.app_cursor = 0
-
-        @kb.add("4")
-        def tab_enabled(event: KeyPressEvent) -> None:
-            if self.state.view == ViewState.APP_LIST and not self.filter_visible:
-                self.state.filter_mode = FilterMode.ENABLED
-                self.state.app_cursor = 0
-
-        @kb.add("5")
-        def tab_disabled(event: KeyPressEvent) -> None:
-            if self.state.view == ViewState.APP_LIST and not self.filter_visible:
-                self.state.filter_mode = FilterMode.DISABLED
-                self.state.app_cursor = 0
+        for key, mode in TAB_KEYS.items():
+            kb.add(key)(make_tab_handler(mode))
 
         # ─── Actions ───────────────────────────────────────────────────────
         @kb.add("D")
@@ -729,6 +861,33 @@ class AppFreezeUI:
 
         return kb
 
+    def _invalidate_throttled(self) -> None:
+        """
+        Request a redraw at most once per REDRAW_INTERVAL.
+
+        Requests inside the interval are coalesced into one trailing redraw,
+        so the last update of a burst is always painted. Safe from any thread.
+        """
+        with self._paint_lock:
+            if self._paint_pending:
+                return
+            delay = self._last_invalidate + REDRAW_INTERVAL - time.monotonic()
+            if delay > 0:
+                self._paint_pending = True
+                timer = threading.Timer(delay, self._flush_invalidate)
+                timer.daemon = True
+                timer.start()
+                return
+            self._last_invalidate = time.monotonic()
+        self.app.invalidate()
+
+    def _flush_invalidate(self) -> None:
+        """Issue a redraw coalesced by _invalidate_throttled."""
+        with self._paint_lock:
+            self._paint_pending = False
+            self._last_invalidate = time.monotonic()
+        self.app.invalidate()
+
     def _close_filter(self) -> None:
         """Close filter input."""
         self.filter_visible = False
@@ -763,7 +922,7 @@ class AppFreezeUI:
             [
                 # Header - slightly taller for better visual hierarchy
                 Window(
-                    FormattedTextControl(lambda: render_header(self.state)),
+                    FormattedTextControl(self._get_header),
                     height=2,
                     style="class:header",
                 ),
@@ -791,7 +950,7 @@ class AppFreezeUI:
                 filter_bar,
                 # Footer
                 Window(
-                    FormattedTextControl(lambda: render_footer(self.state)),
+                    FormattedTextControl(self._get_footer),
                     height=1,
                     style="class:footer",
                 ),
@@ -804,6 +963,22 @@ class AppFreezeUI:
             ]
         )
 
+    def _memoized(
+        self, name: str, key: object, render: Callable[[UIState], StyleAndText]
+    ) -> StyleAndText:
+        """Return the last fragments rendered for `name` if its inputs `key` are unchanged."""
+        cached = self._render_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        fragments = render(self.state)
+        self._render_cache[name] = (key, fragments)
+        return fragments
+
+    def _get_header(self) -> StyleAndText:
+        """Get header bar content."""
+        key = (self.state.view, self.state.selected_device)
+        return self._memoized("header", key, render_header)
+
     def _get_device_bar(self) -> StyleAndText:
         """Get device info bar content."""
         if self.state.view not in (
@@ -812,88 +987,134 @@ class AppFreezeUI:
             ViewState.RESULT,
         ):
             return []
-        return render_device_info(self.state)
+        return self._memoized("device", self.state.selected_device, render_device_info)
 
     def _get_tabs_bar(self) -> StyleAndText:
         """Get tabs bar content."""
         if self.state.view not in (ViewState.APP_LIST,):
             return []
-        return render_tabs(self.state)
+        return self._memoized("tabs", self.state.filter_mode, render_tabs)
 
     def _get_summary_bar(self) -> StyleAndText:
         """Get summary stats bar content."""
         if self.state.view not in (ViewState.APP_LIST,):
             return []
-        return render_summary(self.state)
+        state = self.state
+        key = (id(state.apps), len(state.apps), state.apps_version)
+        return self._memoized("summary", key, render_summary)
+
+    def _get_footer(self) -> StyleAndText:
+        """Get footer keybinding hints."""
+        key = (self.state.view, len(self.state.selected_packages))
+        return self._memoized("footer", key, render_footer)
 
     def _get_loading_status(self) -> StyleAndText:
         """Get loading status message."""
-        if self.state.view != ViewState.LOADING or not self.state.loading_status:
+        loading = self.state.view == ViewState.LOADING or self.state.refreshing_apps
+        if not loading or not self.state.loading_status:
             return []
         return [("class:progress", f" ⏳ {self.state.loading_status}")]
 
     def _get_content(self) -> StyleAndText:
         """Generate main content based on current view."""
-        if self.state.view == ViewState.LOADING:
-            return [("", "\n\n  Loading...")]
-
-        if self.state.view == ViewState.ERROR:
-            return render_error(self.state)
-
-        if self.state.view == ViewState.DEVICE_SELECT:
-            return render_device_list(self.state)
-
-        if self.state.view == ViewState.CONFIRM:
-            return render_confirm(self.state)
-
-        if self.state.view == ViewState.EXECUTING:
-            return render_execution(self.state)
+        render = self._content_renderers.get(self.state.view)
+        return render() if render is not None else []
 
-        if self.state.view == ViewState.RESULT:
-            return render_result(self.state)
+    def _render_loading(self) -> StyleAndText:
+        """Render the loading placeholder."""
+        return [("", "\n\n  Loading...")]
 
-        if self.state.view == ViewState.APP_LIST:
-            # Get terminal size for responsive list
-            try:
-                size = self.app.output.get_size()
-                height = size.rows
-            except Exception:
-                height = 25
-            return render_app_list(self.state, height)
-
-        return []
+    def _render_app_list(self) -> StyleAndText:
+        """Render the app list sized to the terminal."""
+        # Get terminal size for responsive list
+        try:
+            size = self.app.output.get_size()
+            height = size.rows
+        except Exception:
+            height = 25
+        return render_app_list(self.state, height)
 
     def _select_device(self, device: DeviceInfo) -> None:
-        """Handle device selection and load apps."""
+        """Handle device selection and load apps. Blocks; run from a worker thread."""
         self.state.selected_device = device
         self.state.view = ViewState.LOADING
         self.state.loading_status = f"Connecting to {device.display_name or device.device_id}..."
         self.app.invalidate()
 
-        try:
-            if self.adb:
+        if not self.adb:
+            return
 
-                def progress_callback(package: str, current: int, total: int) -> None:
-                    """Update loading status with current package."""
-                    self.state.loading_status = (
-                        f"Fetching app details ({current}/{total})... {package}"
-                    )
-                    self.app.invalidate()
-
-                self.state.apps = self.adb.list_apps(
-                    device.device_id,
-                    include_system=True,
-                    include_user=True,
-                    fetch_sizes=True,
-                    progress_callback=progress_callback,
+        try:
+            # Show a preview right away: the list saved on a previous run, or else
+            # package names and states only (no per-app queries). Details load below.
+            preview = self.adb.load_cached_apps(device.device_id)
+            if not preview:
+                self.state.loading_status = "Listing packages..."
+                self._invalidate_throttled()
+                preview = self.adb.list_apps(
+                    device.device_id, include_system=True, include_user=True, fast_mode=True
                 )
-
-                self.state.loading_status = f"Loaded {len(self.state.apps)} apps"
-                self.app.invalidate()
-                self.state.view = ViewState.APP_LIST
+            self.state.apps = preview
+            self.state.mark_apps_changed()
+            self.state.view = ViewState.APP_LIST
+            self.app.invalidate()
         except ADBError as e:
             self.state.error_msg = str(e)
             self.state.view = ViewState.ERROR
+            self.app.invalidate()
+            return
+
+        with self._apps_lock:
+            self._acted_states.clear()
+        # Keep the status line visible in the app list while details load
+        self.state.refreshing_apps = True
+        try:
+
+            def progress_callback(package: str, current: int, total: int) -> None:
+                """Update loading status with current package."""
+                self.state.loading_status = f"Fetching app details ({current}/{total})... {package}"
+                self._invalidate_throttled()
+
+            apps = self.adb.list_apps(
+                device.device_id,
+                include_system=True,
+                include_user=True,
+                fetch_sizes=True,
+                progress_callback=progress_callback,
+            )
+        except ADBError:
+            # The preview stays usable
+            return
+        else:
+            with self._apps_lock:
+                # Actions that finished during the load may postdate what it read
+                apps = self._apply_acted_states(apps)
+                self.state.apps = apps
+                self.state.mark_apps_changed()
+                count = self.state.filtered_len()
+                self.state.app_cursor = min(self.state.app_cursor, count - 1) if count else 0
+                # Cleared with the swap so _reload_apps never sees the preview as final
+                self.state.refreshing_apps = False
+        finally:
+            self.state.refreshing_apps = False
+            self.app.invalidate()
+        self.adb.save_cached_apps(device.device_id, apps)
+        self.state.loading_status = f"Loaded {len(apps)} apps"
+        self.app.invalidate()
+
+    def _apply_acted_states(self, apps: list[AppInfo]) -> list[AppInfo]:
+        """Set enabled states recorded by actions onto refreshed apps. Call under _apps_lock."""
+        acted = self._acted_states
+        if not acted:
+            return apps
+        return [
+            (
+                replace(app, is_enabled=acted[app.package_name])
+                if acted.get(app.package_name, app.is_enabled) != app.is_enabled
+                else app
+            )
+            for app in apps
+        ]
 
     def _execute_action(self) -> None:
         """Execute the pending enable/disable action."""
@@ -905,32 +1126,38 @@ class AppFreezeUI:
         packages = list(self.state.selected_packages)
         self.state.execution_total = len(packages)
         self.state.execution_progress = 0
-        self.state.execution_current = ""
+        self.state.execution_current = packages[0] if packages else ""
 
         # Show executing view immediately
         self.app.invalidate()
 
         device_id = self.state.selected_device.device_id
-        action = self.state.pending_action
-
-        for pkg in packages:
-            # Set current package and show it before processing
-            self.state.execution_current = pkg
-            self.app.invalidate()
-
-            try:
-                if action == AppAction.DISABLE:
-                    success, msg = self.adb.disable_app(device_id, pkg)
-                else:
-                    success, msg = self.adb.enable_app(device_id, pkg)
-
-                error = None if success else msg
-                self.state.execution_results.append((pkg, success, error))
-            except ADBError as e:
-                self.state.execution_results.append((pkg, False, str(e)))
 
+        def on_result(pkg: str, success: bool, error: str | None) -> None:
+            """Record one package result and show the next package."""
+            self.state.execution_results.append((pkg, success, error))
             self.state.execution_progress += 1
-            self.app.invalidate()
+            done = self.state.execution_progress
+            self.state.execution_current = packages[done] if done < len(packages) else ""
+            self._invalidate_throttled()
+
+        try:
+            # All packages go over one adb shell session
+            self.adb.enable_disable_apps(
+                device_id,
+                packages,
+                enable=self.state.pending_action is AppAction.ENABLE,
+                user_ids=[0],
+                progress_callback=on_result,
+            )
+        except ADBError as e:
+            # Session could not be used; report the remaining packages as failed
+            finished = {pkg for pkg, _, _ in self.state.execution_results}
+            for pkg in packages:
+                if pkg not in finished:
+                    self.state.execution_results.append((pkg, False, str(e)))
+            self.state.execution_progress = len(packages)
+        self.app.invalidate()
 
         # Write report
         self._write_report()
@@ -939,6 +1166,7 @@ class AppFreezeUI:
         self._reload_apps()
         self.state.selected_packages.clear()
         self.state.view = ViewState.RESULT  # Show result log
+        self.app.invalidate()
 
     def _write_report(self) -> None:
         """Write operation report to file."""
@@ -958,51 +1186,65 @@ class AppFreezeUI:
         self.report_writer.write_report(report)
 
     def _reload_apps(self) -> None:
-        """Update only the affected apps in the list instead of full reload."""
-        if not self.adb or not self.state.selected_device:
+        """Apply successful enable/disable results to the app list in place."""
+        # Failed packages did not change on the device
+        changed = {pkg for pkg, success, _ in self.state.execution_results if success}
+        if not changed or not self.state.pending_action:
             return
 
-        # Only update apps that were just modified
-        affected_packages = {pkg for pkg, _, _ in self.state.execution_results}
-        if not affected_packages:
-            return
-
-        # Update apps in place
-        for i, app in enumerate(self.state.apps):
-            if app.package_name in affected_packages:
-                try:
-                    # Fetch updated info for this app
-                    updated_app = self.adb.get_app_info(
-                        self.state.selected_device.device_id,
-                        app.package_name,
-                        fetch_size=True,
-                    )
-                    # Replace in list
-                    self.state.apps[i] = updated_app
-                except ADBError:
-                    # Keep old data if update fails
-                    pass
+        # Toggling only flips the enabled state; size, version and label are unchanged,
+        # so no adb round-trip per package is needed
+        enabled = self.state.pending_action is AppAction.ENABLE
+        with self._apps_lock:
+            apps = self.state.apps
+            positions = self.state.app_positions()
+            for pkg in changed:
+                # Recorded so a detail load in flight keeps this newer state
+                self._acted_states[pkg] = enabled
+                i = positions.get(pkg)
+                if i is not None and apps[i].is_enabled != enabled:
+                    apps[i] = replace(apps[i], is_enabled=enabled)
+            self.state.mark_apps_changed()
+            # The shown list is still the detail-less preview; the load saves the full one
+            preview = self.state.refreshing_apps
+
+        # Keep the startup cache in line with the device
+        if self.adb and self.state.selected_device and not preview:
+            self.adb.save_cached_apps(self.state.selected_device.device_id, apps)
 
     def _initialize_in_background(self) -> None:
         """Initialize ADB and load devices in background thread."""
         try:
+            # Status steps can be quicker than a frame; coalesce their redraws
             self.state.loading_status = "Initializing ADB..."
-            self.app.invalidate()
-            self.adb = ADBClient()
+            self._invalidate_throttled()
+            self.adb = ADBClient(persist=True, warmup=True)
 
             self.state.loading_status = "Scanning for devices..."
-            self.app.invalidate()
+            self._invalidate_throttled()
             devices = self.adb.get_ready_devices()
 
-            # Get detailed device info
-            detailed: list[DeviceInfo] = []
-            for i, dev in enumerate(devices, 1):
-                self.state.loading_status = f"Getting device info ({i}/{len(devices)})..."
-                self.app.invalidate()
+            # Get detailed device info for all devices in parallel
+            self.state.loading_status = f"Getting device info ({len(devices)} devices)..."
+            self._invalidate_throttled()
+            adb = self.adb
+
+            def device_info(dev: DeviceInfo) -> DeviceInfo:
+                """Fetch full info, falling back to the basic listing entry."""
                 try:
-                    detailed.append(self.adb.get_device_info(dev.device_id))
+                    return adb.get_device_info(dev.device_id)
                 except Exception:
-                    detailed.append(dev)
+                    return dev
+
+            detailed = list(devices)
+            with ThreadPoolExecutor(max_workers=min(8, len(devices)) or 1) as executor:
+                futures = {executor.submit(device_info, dev): i for i, dev in enumerate(devices)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    detailed[futures[future]] = future.result()
+                    self.state.loading_status = (
+                        f"Getting device info ({done}/{len(devices)} devices)..."
+                    )
+                    self._invalidate_throttled()
 
             self.state.devices = detailed
 
@@ -5,12 +5,16 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from app_freeze.state import AppAction
+
 if TYPE_CHECKING:
     from app_freeze.adb.models import DeviceInfo
-    from app_freeze.state import AppAction
+
+# Results table status column, indexed by success
+_STATUS_MARKS = ("✗", "✓")
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """Result of an app operation."""
 
@@ -19,12 +23,12 @@ class OperationResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationReport:
     """Complete report for an operation session."""
 
     device: "DeviceInfo"
-    action: "AppAction"
+    action: AppAction
     timestamp: datetime
     results: list[OperationResult]
 
@@ -41,7 +45,7 @@ class OperationReport:
     @property
     def failure_count(self) -> int:
         """Number of failed operations."""
-        return sum(1 for r in self.results if not r.success)
+        return self.total_count - self.success_count
 
 
 class ReportWriter:
@@ -89,7 +93,7 @@ class ReportWriter:
         Returns:
             Markdown formatted report content.
         """
-        action_str = "Enable" if report.action.name == "ENABLE" else "Disable"
+        action_str = "Enable" if report.action is AppAction.ENABLE else "Disable"
         timestamp_str = report.timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
         lines: list[str] = []
@@ -116,13 +120,15 @@ class ReportWriter:
             lines.append(f"- **SDK Level:** {report.device.sdk_level}")
         lines.append("")
 
-        # Summary
+        # Summary; counts derive from one pass collecting the failures
+        failures = [r for r in report.results if not r.success]
+        total = len(report.results)
         lines.append("## Summary")
         lines.append("")
         lines.append(f"- **Action:** {action_str}")
-        lines.append(f"- **Total Apps:** {report.total_count}")
-        lines.append(f"- **Successful:** {report.success_count}")
-        lines.append(f"- **Failed:** {report.failure_count}")
+        lines.append(f"- **Total Apps:** {total}")
+        lines.append(f"- **Successful:** {total - len(failures)}")
+        lines.append(f"- **Failed:** {len(failures)}")
         lines.append("")
 
         # Results table
@@ -131,15 +137,14 @@ class ReportWriter:
         lines.append("| Status | Package Name | Error |")
         lines.append("|--------|-------------|-------|")
 
-        for result in report.results:
-            status = "✓" if result.success else "✗"
-            error = result.error or ""
-            lines.append(f"| {status} | {result.package} | {error} |")
+        lines.extend(
+            f"| {_STATUS_MARKS[r.success]} | {r.package} | {r.error or ''} |"
+            for r in report.results
+        )
 
         lines.append("")
 
         # Failures detail (if any)
-        failures = [r for r in report.results if not r.success]
         if failures:
             lines.append("## Failed Operations")
             lines.append("")
@@ -25,7 +25,7 @@ class AppAction(Enum):
     DISABLE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Overall application state."""
 
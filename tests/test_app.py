@@ -1,7 +1,8 @@
 """Tests for the prompt_toolkit-based UI."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from app_freeze.adb.errors import ADBError
 from app_freeze.adb.models import AppInfo, DeviceInfo, DeviceState
 from app_freeze.app import (
     AppFreezeUI,
@@ -40,6 +41,10 @@ class TestUIState:
         assert state.selected_packages == set()
         assert state.filter_mode == FilterMode.ALL
 
+    def test_slots(self) -> None:
+        """Test state uses slots instead of an instance dict."""
+        assert not hasattr(UIState(), "__dict__")
+
     def test_filtered_apps_no_filter(self) -> None:
         """Test filtered_apps with no filter returns all."""
         state = UIState()
@@ -71,6 +76,18 @@ class TestUIState:
         result = state.filtered_apps()
         assert len(result) == 1
 
+    def test_filtered_apps_multiple_terms(self) -> None:
+        """Test space-separated filter terms must all match."""
+        state = UIState()
+        state.apps = [
+            AppInfo(package_name="com.google.android.youtube", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.google.android.gm", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.vanced.youtube", is_system=False, is_enabled=True),
+        ]
+        state.filter_text = "google  youtube "
+        result = state.filtered_apps()
+        assert [a.package_name for a in result] == ["com.google.android.youtube"]
+
     def test_filtered_apps_enabled_filter(self) -> None:
         """Test filtered_apps with enabled filter."""
         state = UIState()
@@ -133,6 +150,64 @@ class TestUIState:
         assert len(result) == 1
         assert result[0].package_name == "com.google.enabled"
 
+    def test_filtered_apps_cached(self) -> None:
+        """Test filtered_apps reuses its result until apps or filter change."""
+        state = UIState()
+        state.apps = [
+            AppInfo(package_name="com.google.app", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.other.app", is_system=False, is_enabled=False),
+        ]
+        first = state.filtered_apps()
+        assert state.filtered_apps() is first
+
+        state.filter_mode = FilterMode.ENABLED
+        assert [a.package_name for a in state.filtered_apps()] == ["com.google.app"]
+
+        state.apps[0] = AppInfo(package_name="com.google.app", is_system=False, is_enabled=False)
+        state.mark_apps_changed()
+        assert state.filtered_apps() == []
+
+    def test_filtered_apps_uses_one_apps_read(self) -> None:
+        """Test a text filter over a list other than `apps` does not mix the two."""
+        state = UIState()
+        state.apps = [AppInfo(package_name="com.old.app", is_system=False, is_enabled=True)]
+        state.filter_text = "app"
+        assert len(state.filtered_apps()) == 1
+
+        # As if a worker swapped `apps` while this list was being filtered
+        swapped = [
+            AppInfo(package_name="com.new.app", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.new.tool", is_system=False, is_enabled=True),
+        ]
+        result = state._compute_filtered_apps(swapped)
+        assert [a.package_name for a in result] == ["com.new.app"]
+
+    def test_filtered_len_and_at(self) -> None:
+        """Test filtered_len and filtered_at follow the current filter."""
+        state = UIState()
+        state.apps = [
+            AppInfo(package_name="com.user.app", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.system.app", is_system=True, is_enabled=True),
+        ]
+        state.filter_mode = FilterMode.SYSTEM
+        assert state.filtered_len() == 1
+        app = state.filtered_at(0)
+        assert app is not None and app.package_name == "com.system.app"
+        assert state.filtered_at(1) is None
+
+    def test_app_positions(self) -> None:
+        """Test package index follows app list changes."""
+        state = UIState()
+        state.apps = [
+            AppInfo(package_name="com.a", is_system=False, is_enabled=True),
+            AppInfo(package_name="com.b", is_system=False, is_enabled=True),
+        ]
+        assert state.app_positions() == {"com.a": 0, "com.b": 1}
+
+        state.apps = [AppInfo(package_name="com.b", is_system=False, is_enabled=True)]
+        state.mark_apps_changed()
+        assert state.app_positions() == {"com.b": 0}
+
     def test_get_stats(self) -> None:
         """Test get_stats returns correct counts."""
         state = UIState()
@@ -148,6 +223,17 @@ class TestUIState:
         assert stats["enabled"] == 2
         assert stats["disabled"] == 1
 
+    def test_get_stats_follows_app_changes(self) -> None:
+        """Test cached stats are recounted after apps change."""
+        state = UIState()
+        state.apps = [AppInfo(package_name="app", is_system=False, is_enabled=True)]
+        assert state.get_stats()["enabled"] == 1
+
+        state.apps[0] = AppInfo(package_name="app", is_system=False, is_enabled=False)
+        state.mark_apps_changed()
+        assert state.get_stats()["enabled"] == 0
+        assert state.get_stats()["disabled"] == 1
+
     def test_get_stats_empty(self) -> None:
         """Test get_stats with no apps."""
         state = UIState()
@@ -276,6 +362,43 @@ class TestRenderers:
         text = "".join(t for _, t in result)
         assert "No apps match filter" in text
 
+    def test_render_app_list_rebuilds_row_for_updated_app(self) -> None:
+        """Test cached rows are rebuilt when an app is replaced."""
+        state = UIState()
+        state.apps = [AppInfo(package_name="com.test.app", is_system=False, is_enabled=True)]
+        render_app_list(state, height=20)
+
+        state.apps[0] = AppInfo(package_name="com.test.app", is_system=False, is_enabled=False)
+        state.mark_apps_changed()
+        text = "".join(t for _, t in render_app_list(state, height=20))
+        assert "✗" in text
+        assert "✓" not in text
+
+    def test_render_app_list_system_marker(self) -> None:
+        """Test system apps get a styled marker and user apps keep the column aligned."""
+        state = UIState()
+        state.apps = [
+            AppInfo(package_name="com.sys.app", is_system=True, is_enabled=True),
+            AppInfo(package_name="com.user.app", is_system=False, is_enabled=True),
+        ]
+        result = render_app_list(state, height=20)
+        assert ("class:app.system", " [S]") in result
+        rows = "".join(t for _, t in result).splitlines()
+        sys_row = next(r for r in rows if "com.sys.app" in r)
+        user_row = next(r for r in rows if "com.user.app" in r)
+        assert sys_row.index("com.sys.app") == user_row.index("com.user.app")
+
+    def test_mark_apps_changed_drops_cached_rows(self) -> None:
+        """Test cached rows for a previous app list are released."""
+        state = UIState()
+        state.apps = [AppInfo(package_name="com.test.app", is_system=False, is_enabled=True)]
+        render_app_list(state, height=20)
+        assert "com.test.app" in state.row_cache
+
+        state.apps = []
+        state.mark_apps_changed()
+        assert state.row_cache == {}
+
     def test_render_app_list_with_selection(self) -> None:
         """Test app list shows selection marker."""
         state = UIState()
@@ -298,6 +421,16 @@ class TestRenderers:
         assert "1 app" in text
         assert "[y]" in text
 
+    def test_render_confirm_lists_first_ten_sorted(self) -> None:
+        """Test a large selection previews the first ten packages in order."""
+        state = UIState()
+        state.pending_action = AppAction.ENABLE
+        state.selected_packages = {f"com.app{i:02d}" for i in range(25)}
+        text = "".join(t for _, t in render_confirm(state))
+        listed = [line.strip("• ") for line in text.splitlines() if "•" in line]
+        assert listed == [f"com.app{i:02d}" for i in range(10)]
+        assert "and 15 more" in text
+
     def test_render_execution(self) -> None:
         """Test execution progress rendering."""
         state = UIState()
@@ -315,6 +448,19 @@ class TestRenderers:
         assert "✓" in text
         assert "✗" in text
 
+    def test_render_execution_progress_bar(self) -> None:
+        """Test the progress bar fills in proportion to progress."""
+        state = UIState()
+        state.pending_action = AppAction.DISABLE
+        state.execution_total = 4
+        state.execution_progress = 1
+        text = "".join(t for _, t in render_execution(state))
+        assert "[" + "█" * 10 + "░" * 30 + "]" in text
+
+        state.execution_progress = 4
+        text = "".join(t for _, t in render_execution(state))
+        assert "[" + "█" * 40 + "]" in text
+
     def test_render_result(self) -> None:
         """Test result log rendering."""
         state = UIState()
@@ -385,6 +531,184 @@ class TestAppFreezeUIInit:
             assert ui.filter_buffer is not None
             assert ui.filter_visible is False
 
+    def test_bars_reuse_fragments_until_inputs_change(self) -> None:
+        """Test bar fragments are rebuilt only when their inputs change."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.state.view = ViewState.APP_LIST
+            ui.state.apps = [AppInfo(package_name="com.a", is_system=False, is_enabled=True)]
+            summary = ui._get_summary_bar()
+            footer = ui._get_footer()
+            assert ui._get_summary_bar() is summary
+            assert ui._get_footer() is footer
+
+            ui.state.apps.append(AppInfo(package_name="com.b", is_system=True, is_enabled=True))
+            ui.state.mark_apps_changed()
+            ui.state.selected_packages.add("com.b")
+            assert "2" in "".join(t for _, t in ui._get_summary_bar())
+            assert "1 sel" in "".join(t for _, t in ui._get_footer())
+
+    def test_throttled_invalidate_coalesces_burst(self) -> None:
+        """Test a burst of redraw requests paints once now and once at the end."""
+        import time
+
+        from app_freeze.app import REDRAW_INTERVAL
+
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            for _ in range(50):
+                ui._invalidate_throttled()
+            assert ui.app.invalidate.call_count == 1
+            time.sleep(REDRAW_INTERVAL * 3)
+            assert ui.app.invalidate.call_count == 2
+
+    def test_select_device_shows_fast_list_then_details(self) -> None:
+        """Test a quick package list is shown before per-app details arrive."""
+        fast = [AppInfo(package_name="com.a", is_system=False, is_enabled=True)]
+        full = [AppInfo(package_name="com.a", is_system=False, is_enabled=True, size_mb=2.0)]
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.adb.load_cached_apps.return_value = None
+            ui.adb.list_apps.side_effect = [fast, full]
+
+            ui._select_device(DeviceInfo(device_id="dev", state=DeviceState.DEVICE))
+
+            assert ui.adb.list_apps.call_args_list[0].kwargs["fast_mode"] is True
+            assert ui.state.view == ViewState.APP_LIST
+            assert ui.state.apps == full
+            ui.adb.save_cached_apps.assert_called_once_with("dev", full)
+
+    def test_select_device_shows_detail_progress_in_app_list(self) -> None:
+        """Test the detail-loading status line is visible over the preview list."""
+        fast = [AppInfo(package_name="com.a", is_system=False, is_enabled=True)]
+        seen: list[tuple[ViewState, str]] = []
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+
+            def list_apps(*args: object, **kwargs: object) -> list[AppInfo]:
+                if kwargs.get("fast_mode"):
+                    return fast
+                progress = kwargs["progress_callback"]
+                assert callable(progress)
+                progress("com.a", 1, 1)
+                status = "".join(t for _, t in ui._get_loading_status())
+                seen.append((ui.state.view, status))
+                return fast
+
+            ui.adb = MagicMock()
+            ui.adb.load_cached_apps.return_value = None
+            ui.adb.list_apps.side_effect = list_apps
+
+            ui._select_device(DeviceInfo(device_id="dev", state=DeviceState.DEVICE))
+
+            [(view, status)] = seen
+            assert view == ViewState.APP_LIST
+            assert "Fetching app details (1/1)" in status
+            assert ui._get_loading_status() == []
+
+    def test_select_device_keeps_preview_when_details_fail(self) -> None:
+        """Test a failed detail load leaves the preview list in place."""
+        fast = [AppInfo(package_name="com.a", is_system=False, is_enabled=True)]
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.adb.load_cached_apps.return_value = None
+            ui.adb.list_apps.side_effect = [fast, ADBError("gone")]
+
+            ui._select_device(DeviceInfo(device_id="dev", state=DeviceState.DEVICE))
+
+            assert ui.state.view == ViewState.APP_LIST
+            assert ui.state.apps == fast
+
+    def test_refresh_keeps_only_acted_enabled_states(self) -> None:
+        """Test refreshed apps keep action results but take fresh states otherwise."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.state.selected_device = DeviceInfo(device_id="dev", state=DeviceState.DEVICE)
+            ui.state.apps = [
+                AppInfo(package_name="com.a", is_system=False, is_enabled=True),
+                AppInfo(package_name="com.stale", is_system=False, is_enabled=False),
+            ]
+            ui.state.pending_action = AppAction.DISABLE
+            ui.state.execution_results = [("com.a", True, None)]
+            ui._reload_apps()
+
+            refreshed = [
+                AppInfo(package_name="com.a", is_system=False, is_enabled=True, size_mb=1.0),
+                AppInfo(package_name="com.stale", is_system=False, is_enabled=True),
+                AppInfo(package_name="com.new", is_system=False, is_enabled=True),
+            ]
+            merged = ui._apply_acted_states(refreshed)
+            assert [(a.is_enabled, a.size_mb) for a in merged] == [
+                (False, 1.0),
+                (True, 0.0),
+                (True, 0.0),
+            ]
+
+    def test_reload_apps_patches_only_successful_packages(self) -> None:
+        """Test results flip is_enabled in place without querying the device."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.state.selected_device = DeviceInfo(device_id="dev", state=DeviceState.DEVICE)
+            ui.state.apps = [
+                AppInfo(package_name="com.ok", is_system=False, is_enabled=True, size_mb=3.0),
+                AppInfo(package_name="com.fail", is_system=False, is_enabled=True),
+                AppInfo(package_name="com.other", is_system=False, is_enabled=True),
+            ]
+            ui.state.pending_action = AppAction.DISABLE
+            ui.state.execution_results = [("com.ok", True, None), ("com.fail", False, "err")]
+
+            ui._reload_apps()
+
+            assert [a.is_enabled for a in ui.state.apps] == [False, True, True]
+            assert ui.state.apps[0].size_mb == 3.0
+            ui.adb.get_app_info.assert_not_called()
+            ui.adb.save_cached_apps.assert_called_once_with("dev", ui.state.apps)
+
+    def test_reload_apps_does_not_cache_preview(self) -> None:
+        """Test actions during the detail load leave the startup cache alone."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.state.selected_device = DeviceInfo(device_id="dev", state=DeviceState.DEVICE)
+            ui.state.apps = [AppInfo(package_name="com.ok", is_system=False, is_enabled=True)]
+            ui.state.refreshing_apps = True
+            ui.state.pending_action = AppAction.DISABLE
+            ui.state.execution_results = [("com.ok", True, None)]
+
+            ui._reload_apps()
+
+            assert ui.state.apps[0].is_enabled is False
+            ui.adb.save_cached_apps.assert_not_called()
+
+    def test_reload_apps_skipped_when_nothing_succeeded(self) -> None:
+        """Test an all-failed action leaves the app list untouched."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.adb = MagicMock()
+            ui.state.pending_action = AppAction.DISABLE
+            ui.state.execution_results = [("com.fail", False, "err")]
+            version = ui.state.apps_version
+
+            ui._reload_apps()
+
+            assert ui.state.apps_version == version
+            ui.adb.save_cached_apps.assert_not_called()
+
+    def test_content_renderer_for_every_view(self) -> None:
+        """Test every view has a content renderer."""
+        with patch("app_freeze.app.Application"):
+            ui = AppFreezeUI()
+            ui.state.error_msg = "boom"
+            for view in ViewState:
+                ui.state.view = view
+                assert ui._get_content(), view
+            ui.state.view = ViewState.ERROR
+            assert "boom" in "".join(t for _, t in ui._get_content())
+
 
 class TestImportSpeed:
     """Test that imports are fast."""
@@ -1,10 +1,14 @@
 """Tests for ADB client with mocked subprocess."""
 
+import asyncio
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app_freeze.adb.client import ADBClient
+from app_freeze.adb.client import ADBClient, _resolve_adb
 from app_freeze.adb.errors import (
     ADBCommandError,
     ADBDeviceDisconnectedError,
@@ -13,12 +17,26 @@ from app_freeze.adb.errors import (
     ADBPermissionError,
     ADBTimeoutError,
 )
-from app_freeze.adb.models import DeviceState
+from app_freeze.adb.models import AppInfo, DeviceState
+
+
+def _spool(result: MagicMock, kwargs: dict[str, Any]) -> MagicMock:
+    """Write mocked output into the temp files used for large_output commands."""
+    if hasattr(kwargs.get("stdout"), "write"):
+        kwargs["stdout"].write(result.stdout)
+        kwargs["stderr"].write(result.stderr)
+    return result
 
 
 class TestADBClientInit:
     """Tests for ADBClient initialization."""
 
+    @pytest.fixture(autouse=True)
+    def clear_adb_cache(self) -> Iterator[None]:
+        _resolve_adb.cache_clear()
+        yield
+        _resolve_adb.cache_clear()
+
     def test_explicit_path(self) -> None:
         client = ADBClient(adb_path="/usr/bin/adb")
         assert client._adb_path == "/usr/bin/adb"
@@ -40,6 +58,78 @@ class TestADBClientInit:
         with patch("shutil.which", return_value=None):
             assert ADBClient.check_adb_available() is False
 
+    def test_persist_uses_xdg_cache_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        client = ADBClient(adb_path="/usr/bin/adb", persist=True)
+        assert client._cache.path == tmp_path / "app-freeze" / "devices.json"
+
+    def test_cached_apps_keyed_by_live_fingerprint(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        client = ADBClient(adb_path="/usr/bin/adb", persist=True)
+        apps = [AppInfo(package_name="com.a", is_system=False, is_enabled=True)]
+        fingerprint = b"google/old:13/1:user/release-keys\n"
+
+        def mock_run(cmd: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = fingerprint
+            result.stderr = b""
+            return result
+
+        with (
+            patch("subprocess.run", side_effect=mock_run) as run,
+            patch.object(client, "get_device_info") as device_info,
+        ):
+            client.save_cached_apps("dev", apps)
+            assert client.load_cached_apps("dev") == apps
+            assert run.call_args[0][0][-2:] == ["getprop", "ro.build.fingerprint"]
+
+            # A system update changes the live fingerprint
+            fingerprint = b"google/new:14/2:user/release-keys\n"
+            assert client.load_cached_apps("dev") is None
+            device_info.assert_not_called()
+
+    def test_no_persist_by_default(self) -> None:
+        client = ADBClient(adb_path="/usr/bin/adb")
+        assert client._cache.path is None
+
+    def test_warmup_starts_server(self) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b""
+        mock_result.stderr = b""
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            ADBClient(adb_path="/usr/bin/adb", warmup=True)
+            assert mock_run.call_args[0][0] == ["/usr/bin/adb", "start-server"]
+
+    def test_warmup_failure_ignored(self) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = b""
+        mock_result.stderr = b"could not start server"
+
+        with patch("subprocess.run", return_value=mock_result):
+            client = ADBClient(adb_path="/usr/bin/adb", warmup=True)
+            assert client.start_server() is False
+
+    def test_adb_lookup_cached(self) -> None:
+        with patch("shutil.which", return_value="/usr/bin/adb") as mock_which:
+            ADBClient()
+            ADBClient()
+            assert ADBClient.check_adb_available() is True
+            assert mock_which.call_count == 1
+
+    def test_failed_lookup_not_cached(self) -> None:
+        with patch("shutil.which", return_value=None):
+            assert ADBClient.check_adb_available() is False
+        with patch("shutil.which", return_value="/usr/bin/adb"):
+            assert ADBClient.check_adb_available() is True
+
 
 class TestADBClientRun:
     """Tests for ADBClient._run method."""
@@ -51,19 +141,43 @@ class TestADBClientRun:
     def test_successful_command(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"output"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             stdout, stderr = client._run(["devices"])
             assert stdout == "output"
             assert stderr == ""
 
+    def test_fds_not_closed_on_posix(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b""
+        mock_result.stderr = b""
+
+        with (
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+            patch("app_freeze.adb.client.CLOSE_FDS", False),
+        ):
+            client._run(["devices"])
+            assert mock_run.call_args.kwargs["close_fds"] is False
+
+    def test_output_decoded_as_utf8(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "nonLocalizedLabel=Café\n".encode() + b"\xff\n"
+        mock_result.stderr = b""
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            stdout, _ = client._run(["shell", "dumpsys"])
+            assert "text" not in mock_run.call_args.kwargs
+            assert stdout == "nonLocalizedLabel=Café\n\ufffd\n"
+
     def test_command_with_device_id(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"output"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
             client._run(["shell", "pm", "list", "packages"], device_id="device123")
@@ -82,8 +196,8 @@ class TestADBClientRun:
     def test_command_error(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "error message"
+        mock_result.stdout = b""
+        mock_result.stderr = b"error message"
 
         with patch("subprocess.run", return_value=mock_result):
             with pytest.raises(ADBCommandError) as exc_info:
@@ -91,12 +205,40 @@ class TestADBClientRun:
             assert exc_info.value.exit_code == 1
             assert "error message" in exc_info.value.stderr
 
+    def test_large_output_spooled_to_file(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"package:com.example.app\n" * 1000
+        mock_result.stderr = b""
+
+        def mock_run(cmd: list[str], **kwargs: Any) -> MagicMock:
+            assert "capture_output" not in kwargs
+            return _spool(mock_result, kwargs)
+
+        with patch("subprocess.run", side_effect=mock_run):
+            stdout, stderr = client._run(["shell", "pm", "list", "packages"], large_output=True)
+            assert stdout == mock_result.stdout.decode()
+            assert stderr == ""
+
+    def test_large_output_command_error(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = b""
+        mock_result.stderr = b"error message"
+
+        with (
+            patch("subprocess.run", side_effect=lambda cmd, **kw: _spool(mock_result, kw)),
+            pytest.raises(ADBCommandError) as exc_info,
+        ):
+            client._run(["shell", "dumpsys"], large_output=True)
+        assert exc_info.value.stderr == "error message"
+
     def test_device_not_found_error(self, client: ADBClient) -> None:
         """Test that device disconnected error is raised for specific device."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "error: device not found"
+        mock_result.stdout = b""
+        mock_result.stderr = b"error: device not found"
 
         with (
             patch("subprocess.run", return_value=mock_result),
@@ -104,12 +246,36 @@ class TestADBClientRun:
         ):
             client._run(["shell", "pm"], device_id="missing-device")
 
+    def test_device_offline_error_without_device_id(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = b""
+        mock_result.stderr = b"error: Device Offline"
+
+        with (
+            patch("subprocess.run", return_value=mock_result),
+            pytest.raises(ADBDeviceNotFoundError),
+        ):
+            client._run(["shell", "pm"])
+
+    def test_not_found_without_device_is_command_error(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 1
+        mock_result.stdout = b""
+        mock_result.stderr = b"error: file not found"
+
+        with (
+            patch("subprocess.run", return_value=mock_result),
+            pytest.raises(ADBCommandError),
+        ):
+            client._run(["pull", "/sdcard/x"], device_id="test-device")
+
     def test_permission_error(self, client: ADBClient) -> None:
         """Test that permission error is raised for permission denied."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "error: permission denied"
+        mock_result.stdout = b""
+        mock_result.stderr = b"error: permission denied"
 
         with (
             patch("subprocess.run", return_value=mock_result),
@@ -131,8 +297,8 @@ class TestADBClientListDevices:
     def test_no_devices(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "List of devices attached\n"
-        mock_result.stderr = ""
+        mock_result.stdout = b"List of devices attached\n"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             devices = client.list_devices()
@@ -141,10 +307,10 @@ class TestADBClientListDevices:
     def test_single_device(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 emulator-5554          device product:sdk_phone model:Pixel_4 transport_id:1
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             devices = client.list_devices()
@@ -156,12 +322,12 @@ emulator-5554          device product:sdk_phone model:Pixel_4 transport_id:1
     def test_multiple_devices(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 device2          device product:prod2 model:Model_2 transport_id:2
 device3          offline
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             devices = client.list_devices()
@@ -171,6 +337,48 @@ device3          offline
             assert devices[2].device_id == "device3"
             assert devices[2].state == DeviceState.OFFLINE
 
+    def test_recent_listing_reused_with_cache(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"List of devices attached\ndevice1 device model:Model_1\n"
+        mock_result.stderr = b""
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            client.get_ready_devices()
+            client.validate_device("device1")
+            client.select_device()
+            assert mock_run.call_count == 1
+
+            # Uncached calls always hit adb
+            client.list_devices()
+            assert mock_run.call_count == 2
+
+    def test_stale_listing_refetched(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"List of devices attached\ndevice1 device\n"
+        mock_result.stderr = b""
+
+        with (
+            patch("subprocess.run", return_value=mock_result) as mock_run,
+            patch("time.monotonic", side_effect=[100.0, 101.0, 101.0]),
+        ):
+            client.get_ready_devices()
+            client.get_ready_devices()
+            assert mock_run.call_count == 2
+
+    def test_invalidate_cache_drops_listing(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"List of devices attached\ndevice1 device\n"
+        mock_result.stderr = b""
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            client.get_ready_devices()
+            client.invalidate_cache()
+            client.get_ready_devices()
+            assert mock_run.call_count == 2
+
 
 class TestADBClientGetDeviceInfo:
     """Tests for ADBClient.get_device_info."""
@@ -182,8 +390,8 @@ class TestADBClientGetDeviceInfo:
     def test_device_not_found(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "List of devices attached\n"
-        mock_result.stderr = ""
+        mock_result.stdout = b"List of devices attached\n"
+        mock_result.stderr = b""
 
         with (
             patch("subprocess.run", return_value=mock_result),
@@ -194,10 +402,10 @@ class TestADBClientGetDeviceInfo:
     def test_fetches_full_info(self, client: ADBClient) -> None:
         devices_result = MagicMock()
         devices_result.returncode = 0
-        devices_result.stdout = """List of devices attached
+        devices_result.stdout = b"""List of devices attached
 ABC123          device product:walleye model:Pixel_2 transport_id:1
 """
-        devices_result.stderr = ""
+        devices_result.stderr = b""
 
         prop_results = {
             "ro.product.model": "Pixel 2",
@@ -209,12 +417,11 @@ ABC123          device product:walleye model:Pixel_2 transport_id:1
         def mock_run(cmd: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            result.stderr = ""
+            result.stderr = b""
             if "devices" in cmd:
                 result.stdout = devices_result.stdout
             elif "getprop" in cmd:
-                prop_name = cmd[-1]
-                result.stdout = prop_results.get(prop_name, "") + "\n"
+                result.stdout = "".join(f"[{k}]: [{v}]\n" for k, v in prop_results.items()).encode()
             return result
 
         with patch("subprocess.run", side_effect=mock_run):
@@ -225,13 +432,34 @@ ABC123          device product:walleye model:Pixel_2 transport_id:1
             assert info.android_version == "14"
             assert info.sdk_level == 34
 
+    def test_fetches_props_in_single_call(self, client: ADBClient) -> None:
+        call_log: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs: object) -> MagicMock:
+            call_log.append(cmd)
+            result = MagicMock()
+            result.returncode = 0
+            result.stderr = b""
+            if "devices" in cmd:
+                result.stdout = b"List of devices attached\nABC123 device model:Test\n"
+            else:
+                result.stdout = b"[ro.build.version.sdk]: [34]\n"
+            return result
+
+        with patch("subprocess.run", side_effect=mock_run):
+            info = client.get_device_info("ABC123")
+            getprop_calls = [c for c in call_log if "getprop" in c]
+            assert getprop_calls == [["/usr/bin/adb", "-s", "ABC123", "shell", "getprop"]]
+            assert info.sdk_level == 34
+            assert info.model == "Test"
+
     def test_caches_result(self, client: ADBClient) -> None:
         devices_result = MagicMock()
         devices_result.returncode = 0
-        devices_result.stdout = """List of devices attached
+        devices_result.stdout = b"""List of devices attached
 ABC123          device product:test model:Test transport_id:1
 """
-        devices_result.stderr = ""
+        devices_result.stderr = b""
 
         call_count = 0
 
@@ -240,14 +468,11 @@ ABC123          device product:test model:Test transport_id:1
             call_count += 1
             result = MagicMock()
             result.returncode = 0
-            result.stderr = ""
+            result.stderr = b""
             if "devices" in cmd:
                 result.stdout = devices_result.stdout
             elif "getprop" in cmd:
-                if "sdk" in cmd[-1]:
-                    result.stdout = "34\n"
-                else:
-                    result.stdout = "value\n"
+                result.stdout = b"[ro.product.model]: [value]\n[ro.build.version.sdk]: [34]\n"
             return result
 
         with patch("subprocess.run", side_effect=mock_run):
@@ -271,10 +496,10 @@ class TestADBClientListUsers:
     def test_single_user(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """Users:
+        mock_result.stdout = b"""Users:
         UserInfo{0:Owner:4c13} running
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             users = client.list_users("device123")
@@ -283,11 +508,11 @@ class TestADBClientListUsers:
     def test_multiple_users(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """Users:
+        mock_result.stdout = b"""Users:
         UserInfo{0:Owner:4c13} running
         UserInfo{10:Work:30} running
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             users = client.list_users("device123")
@@ -304,39 +529,39 @@ class TestADBClientListPackages:
     def test_system_and_user_apps(self, client: ADBClient) -> None:
         call_log: list[list[str]] = []
 
-        system_result = MagicMock()
-        system_result.returncode = 0
-        system_result.stdout = "package:com.android.settings\npackage:com.android.nfc\n"
-        system_result.stderr = ""
-
-        user_result = MagicMock()
-        user_result.returncode = 0
-        user_result.stdout = "package:com.example.app\npackage:com.test.app\n"
-        user_result.stderr = ""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = (
+            b"package:com.android.settings\npackage:com.example.app\n"
+            b"package:com.android.nfc\npackage:com.test.app\n"
+        )
+        mock_result.stderr = b""
 
-        def mock_run(cmd: list[str], **kwargs: object) -> MagicMock:
+        def mock_run(cmd: list[str], **kwargs: Any) -> MagicMock:
             call_log.append(cmd)
-            # System packages: adb -s device123 shell pm list packages -s
-            # User packages: adb -s device123 shell pm list packages -3
-            if "-3" in cmd:
-                return user_result
-            else:
-                return system_result
+            return _spool(mock_result, kwargs)
 
         with patch("subprocess.run", side_effect=mock_run):
             packages = client.list_packages("device123")
-            # Should have called twice: once for -s and once for -3
-            assert len(call_log) == 2
+            # Single unfiltered listing instead of separate -s and -3 calls
+            assert len(call_log) == 1
+            assert call_log[0][-3:] == ["pm", "list", "packages"]
             assert len(packages) == 4
             assert "com.android.settings" in packages
             assert "com.example.app" in packages
             assert packages == sorted(packages)
 
+    def test_no_apps_requested(self, client: ADBClient) -> None:
+        with patch("subprocess.run") as mock_run:
+            packages = client.list_packages("device123", system_apps=False, user_apps=False)
+            assert packages == []
+            mock_run.assert_not_called()
+
     def test_system_apps_only(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "package:com.android.settings\n"
-        mock_result.stderr = ""
+        mock_result.stdout = b"package:com.android.settings\n"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             packages = client.list_packages("device123", system_apps=True, user_apps=False)
@@ -345,14 +570,215 @@ class TestADBClientListPackages:
     def test_user_apps_only(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "package:com.example.app\n"
-        mock_result.stderr = ""
+        mock_result.stdout = b"package:com.example.app\n"
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             packages = client.list_packages("device123", system_apps=False, user_apps=True)
             assert packages == ["com.example.app"]
 
 
+class _FakeSession:
+    """Stand-in for ShellSession that answers commands via a handler."""
+
+    instances: list["_FakeSession"] = []
+
+    def __init__(self, handler: Callable[[str], str]) -> None:
+        self._handler = handler
+        self.commands: list[str] = []
+        self.closed = False
+
+    @classmethod
+    def factory(cls, handler: Callable[[str], str]) -> Callable[..., "_FakeSession"]:
+        cls.instances = []
+
+        def create(cmd: list[str], device_id: str) -> _FakeSession:
+            session = cls(handler)
+            cls.instances.append(session)
+            return session
+
+        return create
+
+    async def run(self, command: str, timeout: float) -> str:
+        self.commands.append(command)
+        return self._handler(command)
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+
+class TestADBClientListApps:
+    """Tests for ADBClient.list_apps."""
+
+    @pytest.fixture
+    def client(self) -> ADBClient:
+        return ADBClient(adb_path="/usr/bin/adb")
+
+    @staticmethod
+    def _mock_listing(call_log: list[list[str]]) -> Callable[..., MagicMock]:
+        def mock_run(cmd: list[str], **kwargs: Any) -> MagicMock:
+            call_log.append(cmd)
+            result = MagicMock()
+            result.returncode = 0
+            result.stderr = b""
+            if cmd[-4:] == ["pm", "list", "packages", "-s"]:
+                result.stdout = b"package:com.android.settings\n"
+            else:
+                result.stdout = b"package:com.android.settings\npackage:com.example.app\n"
+            return _spool(result, kwargs)
+
+        return mock_run
+
+    def test_system_apps_resolved_once(self, client: ADBClient) -> None:
+        call_log: list[list[str]] = []
+        session = _FakeSession.factory(lambda cmd: "User 0: installed=true enabled=0\n")
+
+        with (
+            patch("subprocess.run", side_effect=self._mock_listing(call_log)),
+            patch("app_freeze.adb.client.ShellSession", side_effect=session),
+        ):
+            apps = client.list_apps("device123")
+
+        system_calls = [c for c in call_log if "-s" in c[3:]]
+        assert len(system_calls) == 1
+        assert [a.package_name for a in apps] == ["com.android.settings", "com.example.app"]
+        assert apps[0].is_system is True
+        assert apps[1].is_system is False
+
+    def test_app_queries_share_sessions(self, client: ADBClient) -> None:
+        call_log: list[list[str]] = []
+        session = _FakeSession.factory(lambda cmd: "User 0: installed=true enabled=0\n")
+
+        with (
+            patch("subprocess.run", side_effect=self._mock_listing(call_log)),
+            patch("app_freeze.adb.client.ShellSession", side_effect=session),
+        ):
+            client.list_apps("device123")
+
+        # Only the package listings spawn adb processes
+        assert len(call_log) == 2
+        commands = sorted(c for s in _FakeSession.instances for c in s.commands)
+        assert commands == [
+            "dumpsys package com.android.settings",
+            "dumpsys package com.example.app",
+        ]
+        assert len(_FakeSession.instances) == 2
+        assert all(s.closed for s in _FakeSession.instances)
+
+    def test_failed_apps_skipped_with_progress(self, client: ADBClient) -> None:
+        progress: list[tuple[str, int, int]] = []
+
+        def handler(command: str) -> str:
+            if command.endswith("com.example.app"):
+                raise ADBCommandError(command, 1, "")
+            return "User 0: installed=true enabled=2\n"
+
+        with (
+            patch("subprocess.run", side_effect=self._mock_listing([])),
+            patch("app_freeze.adb.client.ShellSession", side_effect=_FakeSession.factory(handler)),
+        ):
+            apps = client.list_apps(
+                "device123", progress_callback=lambda p, c, t: progress.append((p, c, t))
+            )
+
+        assert [a.package_name for a in apps] == ["com.android.settings"]
+        assert apps[0].is_enabled is False
+        assert sorted(c for _, c, _ in progress) == [1, 2]
+        assert all(t == 2 for _, _, t in progress)
+
+    def test_fast_mode_skips_per_app_queries(self, client: ADBClient) -> None:
+        call_log: list[list[str]] = []
+        listing = self._mock_listing(call_log)
+
+        def mock_run(cmd: list[str], **kwargs: Any) -> MagicMock:
+            if "-d" in cmd:
+                call_log.append(cmd)
+                result = MagicMock()
+                result.returncode = 0
+                result.stdout = b"package:com.example.app\n"
+                result.stderr = b""
+                return result
+            return listing(cmd, **kwargs)
+
+        with (
+            patch("subprocess.run", side_effect=mock_run),
+            patch("app_freeze.adb.client.ShellSession") as mock_session,
+        ):
+            apps = client.list_apps("device123", fast_mode=True)
+
+        mock_session.assert_not_called()
+        assert len(call_log) == 3
+        assert [(a.package_name, a.is_enabled) for a in apps] == [
+            ("com.android.settings", True),
+            ("com.example.app", False),
+        ]
+
+    def test_callable_from_running_event_loop(self, client: ADBClient) -> None:
+        session = _FakeSession.factory(lambda cmd: "User 0: installed=true enabled=0\n")
+
+        async def call_from_loop() -> list[AppInfo]:
+            return client.list_apps("device123")
+
+        with (
+            patch("subprocess.run", side_effect=self._mock_listing([])),
+            patch("app_freeze.adb.client.ShellSession", side_effect=session),
+        ):
+            apps = asyncio.run(call_from_loop())
+
+        assert len(apps) == 2
+
+
+class TestADBClientGetAppInfo:
+    """Tests for ADBClient.get_app_info."""
+
+    @pytest.fixture
+    def client(self) -> ADBClient:
+        return ADBClient(adb_path="/usr/bin/adb")
+
+    def test_size_fetched_in_single_call(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = (
+            b"Packages:\n  versionCode=42 minSdk=24\n  User 0: installed=true enabled=2\n"
+            b"::APPFREEZE::\npackage:/data/app/com.example-1/base.apk\n"
+            b"::APPFREEZE::\n25M\t/data/app/com.example-1\n"
+        )
+        mock_result.stderr = b""
+
+        def mock_run(cmd: list[str], **kwargs: Any) -> MagicMock:
+            return _spool(mock_result, kwargs)
+
+        with patch("subprocess.run", side_effect=mock_run) as run:
+            app = client.get_app_info(
+                "device123", "com.example", fetch_size=True, system_packages=set()
+            )
+            assert run.call_count == 1
+            assert app.size_mb == 25.0
+            assert app.version_code == 42
+            assert app.is_enabled is False
+            assert app.is_system is False
+
+    def test_size_missing_base_apk(self, client: ADBClient) -> None:
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"User 0: installed=true enabled=0\n::APPFREEZE::\n\n::APPFREEZE::\n"
+        mock_result.stderr = b""
+
+        with patch("subprocess.run", side_effect=lambda cmd, **kw: _spool(mock_result, kw)):
+            app = client.get_app_info(
+                "device123", "com.example", fetch_size=True, system_packages={"com.example"}
+            )
+            assert app.size_mb == 0.0
+            assert app.is_enabled is True
+            assert app.is_system is True
+
+
 class TestADBClientDeviceSelection:
     """Tests for device selection functionality."""
 
@@ -363,11 +789,11 @@ class TestADBClientDeviceSelection:
     def test_get_ready_devices_all_ready(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 device2          device product:prod2 model:Model_2 transport_id:2
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             ready = client.get_ready_devices()
@@ -377,12 +803,12 @@ device2          device product:prod2 model:Model_2 transport_id:2
     def test_get_ready_devices_filtered(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 device2          offline
 device3          unauthorized
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             ready = client.get_ready_devices()
@@ -392,11 +818,11 @@ device3          unauthorized
     def test_get_ready_devices_none(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          offline
 device2          unauthorized
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             ready = client.get_ready_devices()
@@ -405,10 +831,10 @@ device2          unauthorized
     def test_validate_device_exists_and_ready(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             device = client.validate_device("device1")
@@ -418,10 +844,10 @@ device1          device product:prod1 model:Model_1 transport_id:1
     def test_validate_device_not_found(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with (
             patch("subprocess.run", return_value=mock_result),
@@ -432,10 +858,10 @@ device1          device product:prod1 model:Model_1 transport_id:1
     def test_validate_device_not_ready(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          offline
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with (
             patch("subprocess.run", return_value=mock_result),
@@ -446,11 +872,11 @@ device1          offline
     def test_select_device_explicit(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 device2          device product:prod2 model:Model_2 transport_id:2
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             device = client.select_device("device1")
@@ -459,10 +885,10 @@ device2          device product:prod2 model:Model_2 transport_id:2
     def test_select_device_auto_single(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             device = client.select_device()
@@ -471,11 +897,11 @@ device1          device product:prod1 model:Model_1 transport_id:1
     def test_select_device_multiple_no_selection(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          device product:prod1 model:Model_1 transport_id:1
 device2          device product:prod2 model:Model_2 transport_id:2
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             with pytest.raises(ADBDeviceNotFoundError) as exc_info:
@@ -487,13 +913,106 @@ device2          device product:prod2 model:Model_2 transport_id:2
     def test_select_device_no_ready(self, client: ADBClient) -> None:
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """List of devices attached
+        mock_result.stdout = b"""List of devices attached
 device1          offline
 device2          unauthorized
 """
-        mock_result.stderr = ""
+        mock_result.stderr = b""
 
         with patch("subprocess.run", return_value=mock_result):
             with pytest.raises(ADBDeviceNotFoundError) as exc_info:
                 client.select_device()
             assert "No ready devices available" in str(exc_info.value)
+
+
+class TestADBClientEnableDisableApps:
+    """Tests for ADBClient.enable_disable_apps."""
+
+    @pytest.fixture
+    def client(self) -> ADBClient:
+        return ADBClient(adb_path="/usr/bin/adb")
+
+    def test_one_command_per_package_for_all_users(self, client: ADBClient) -> None:
+        session = _FakeSession.factory(
+            lambda cmd: "Package com.example.app new state: disabled-user\n::APPFREEZE_USER::0:0\n"
+            "Package com.example.app new state: disabled-user\n::APPFREEZE_USER::10:0\n"
+        )
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=session):
+            results = client.enable_disable_apps(
+                "device123", ["com.example.app"], enable=False, user_ids=[0, 10]
+            )
+
+        assert results == {"com.example.app": (True, None)}
+        [fake] = _FakeSession.instances
+        [script] = fake.commands
+        assert "pm disable-user --user 0 com.example.app" in script
+        assert "pm disable-user --user 10 com.example.app" in script
+        assert fake.closed is True
+
+    def test_packages_share_one_session_with_progress(self, client: ADBClient) -> None:
+        progress: list[tuple[str, bool, str | None]] = []
+        session = _FakeSession.factory(lambda cmd: "new state: enabled\n::APPFREEZE_USER::0:0\n")
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=session):
+            client.enable_disable_apps(
+                "device123",
+                ["com.a", "com.b"],
+                enable=True,
+                user_ids=[0],
+                progress_callback=lambda p, ok, err: progress.append((p, ok, err)),
+            )
+
+        assert len(_FakeSession.instances) == 1
+        assert len(_FakeSession.instances[0].commands) == 2
+        assert progress == [("com.a", True, None), ("com.b", True, None)]
+
+    def test_failure_for_one_user_reported(self, client: ADBClient) -> None:
+        session = _FakeSession.factory(
+            lambda cmd: "Package com.example.app new state: enabled\n::APPFREEZE_USER::0:0\n"
+            "Exception occurred while executing 'enable'\n::APPFREEZE_USER::10:0\n"
+        )
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=session):
+            results = client.enable_disable_apps(
+                "device123", ["com.example.app"], enable=True, user_ids=[0, 10]
+            )
+
+        success, error = results["com.example.app"]
+        assert success is False
+        assert error is not None and "Exception" in error
+
+    def test_nonzero_pm_exit_is_failure(self, client: ADBClient) -> None:
+        session = _FakeSession.factory(lambda cmd: "::APPFREEZE_USER::0:1\n")
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=session):
+            results = client.enable_disable_apps(
+                "device123", ["com.example.app"], enable=False, user_ids=[0]
+            )
+
+        assert results == {"com.example.app": (False, "pm exited with status 1")}
+        [script] = _FakeSession.instances[0].commands
+        assert "echo ::APPFREEZE_USER::0:$?" in script
+
+    def test_truncated_output_is_failure(self, client: ADBClient) -> None:
+        session = _FakeSession.factory(
+            lambda cmd: "Package com.example.app new state: enabled\n::APPFREEZE_USER::0:0\n"
+        )
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=session):
+            results = client.enable_disable_apps(
+                "device123", ["com.example.app"], enable=True, user_ids=[0, 10]
+            )
+
+        assert results["com.example.app"][0] is False
+
+    def test_session_error_is_failure(self, client: ADBClient) -> None:
+        def handler(command: str) -> str:
+            raise ADBTimeoutError(command, 10.0)
+
+        with patch("app_freeze.adb.client.ShellSession", side_effect=_FakeSession.factory(handler)):
+            results = client.enable_disable_apps(
+                "device123", ["com.example.app"], enable=False, user_ids=[0]
+            )
+
+        assert results["com.example.app"][0] is False
@@ -1,8 +1,11 @@
 """Tests for ADB models."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
-from app_freeze.adb.models import AppInfo, DeviceCache, DeviceInfo, DeviceState
+from app_freeze.adb.models import AppInfo, AppListCache, DeviceCache, DeviceInfo, DeviceState
 
 
 class TestDeviceState:
@@ -84,6 +87,10 @@ class TestDeviceInfo:
         with pytest.raises(AttributeError):
             device.device_id = "changed"  # type: ignore[misc]
 
+    def test_slots(self) -> None:
+        device = DeviceInfo(device_id="test", state=DeviceState.DEVICE)
+        assert not hasattr(device, "__dict__")
+
 
 class TestDeviceCache:
     """Tests for DeviceCache."""
@@ -119,6 +126,120 @@ class TestDeviceCache:
         assert cache.get("test1") is None
         assert cache.get("test2") is None
 
+    def test_evicts_least_recently_used(self) -> None:
+        cache = DeviceCache(max_entries=2)
+        for device_id in ("a", "b"):
+            cache.set(device_id, DeviceInfo(device_id=device_id, state=DeviceState.DEVICE))
+        cache.get("a")
+        cache.set("c", DeviceInfo(device_id="c", state=DeviceState.DEVICE))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_ttl_expires_entries(self) -> None:
+        cache = DeviceCache(ttl=5.0)
+        device = DeviceInfo(device_id="test", state=DeviceState.DEVICE)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("test", device)
+        with patch("time.monotonic", return_value=104.0):
+            assert cache.get("test") == device
+        with patch("time.monotonic", return_value=105.0):
+            assert cache.get("test") is None
+
+
+class TestDeviceCachePersistence:
+    """Tests for DeviceCache disk persistence."""
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        device = DeviceInfo(
+            device_id="ABC123",
+            state=DeviceState.DEVICE,
+            model="Pixel 7",
+            manufacturer="Google",
+            sdk_level=34,
+        )
+        DeviceCache(path=path).set("ABC123", device)
+
+        assert DeviceCache(path=path).get("ABC123") == device
+
+    def test_skips_not_ready_devices_on_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        cache = DeviceCache(path=path)
+        cache.set("offline", DeviceInfo(device_id="offline", state=DeviceState.OFFLINE))
+
+        assert DeviceCache(path=path).get("offline") is None
+
+    def test_clear_removes_persisted_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        cache = DeviceCache(path=path)
+        cache.set("test", DeviceInfo(device_id="test", state=DeviceState.DEVICE))
+        cache.clear()
+
+        assert DeviceCache(path=path).get("test") is None
+
+    def test_old_persisted_entries_expire(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        DeviceCache(path=path).set("test", DeviceInfo(device_id="test", state=DeviceState.DEVICE))
+
+        assert DeviceCache(path=path, max_age=3600.0).get("test") is not None
+        assert DeviceCache(path=path, max_age=0.0).get("test") is None
+
+    def test_entries_without_save_time_expire(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        path.write_text(
+            '{"test": {"device_id": "test", "state": "device", "sdk_level": 34}}',
+            encoding="utf-8",
+        )
+
+        assert DeviceCache(path=path).get("test") is None
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "devices.json"
+        path.write_text("not json", encoding="utf-8")
+
+        cache = DeviceCache(path=path)
+        assert cache.get("test") is None
+
+    def test_no_path_does_not_write(self, tmp_path: Path) -> None:
+        cache = DeviceCache()
+        cache.set("test", DeviceInfo(device_id="test", state=DeviceState.DEVICE))
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAppListCache:
+    """Tests for AppListCache."""
+
+    APPS = [
+        AppInfo(package_name="com.a", is_system=True, is_enabled=True, size_mb=1.5),
+        AppInfo(package_name="com.b", is_system=False, is_enabled=False, app_label="B"),
+    ]
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        AppListCache(tmp_path).set("host:5555", "fp1", self.APPS)
+        assert AppListCache(tmp_path).get("host:5555", "fp1") == self.APPS
+
+    def test_fingerprint_mismatch_is_miss(self, tmp_path: Path) -> None:
+        cache = AppListCache(tmp_path)
+        cache.set("dev", "fp1", self.APPS)
+        assert cache.get("dev", "fp2") is None
+
+    def test_empty_fingerprint_not_cached(self, tmp_path: Path) -> None:
+        cache = AppListCache(tmp_path)
+        cache.set("dev", "", self.APPS)
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get("dev", "") is None
+
+    def test_expired_entry_is_miss(self, tmp_path: Path) -> None:
+        cache = AppListCache(tmp_path, ttl=0.0)
+        cache.set("dev", "fp1", self.APPS)
+        assert cache.get("dev", "fp1") is None
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "dev.json").write_text("not json", encoding="utf-8")
+        assert AppListCache(tmp_path).get("dev", "fp1") is None
+
 
 class TestAppInfo:
     """Tests for AppInfo dataclass."""
@@ -158,3 +279,7 @@ class TestAppInfo:
         app = AppInfo(package_name="test", is_system=False, is_enabled=True)
         with pytest.raises(AttributeError):
             app.package_name = "changed"  # type: ignore[misc]
+
+    def test_slots(self) -> None:
+        app = AppInfo(package_name="test", is_system=False, is_enabled=True)
+        assert not hasattr(app, "__dict__")
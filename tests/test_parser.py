@@ -6,6 +6,7 @@ from app_freeze.adb.parser import (
     parse_devices_output,
     parse_du_output,
     parse_dumpsys_package,
+    parse_getprop_output,
     parse_package_path,
     parse_packages_output,
     parse_users_output,
@@ -138,6 +139,31 @@ class TestParseUsersOutput:
         assert result == []
 
 
+class TestParseGetpropOutput:
+    """Tests for parse_getprop_output."""
+
+    def test_parse_props(self) -> None:
+        output = """[ro.build.version.sdk]: [34]
+[ro.product.model]: [Pixel 7]
+[ro.product.manufacturer]: [Google]
+"""
+        result = parse_getprop_output(output)
+        assert result["ro.build.version.sdk"] == "34"
+        assert result["ro.product.model"] == "Pixel 7"
+        assert result["ro.product.manufacturer"] == "Google"
+
+    def test_empty_value(self) -> None:
+        result = parse_getprop_output("[ro.boot.serialno]: []\n")
+        assert result == {"ro.boot.serialno": ""}
+
+    def test_crlf_line_endings(self) -> None:
+        result = parse_getprop_output("[ro.product.model]: [Pixel]\r\n")
+        assert result == {"ro.product.model": "Pixel"}
+
+    def test_empty_output(self) -> None:
+        assert parse_getprop_output("") == {}
+
+
 class TestParsePackagesOutput:
     """Tests for parse_packages_output."""
 
@@ -166,6 +192,10 @@ package:com.test.app2
         result = parse_packages_output(output)
         assert len(result) == 2
 
+    def test_duplicates_removed_in_order(self) -> None:
+        output = "package:com.b\npackage:com.a\npackage:com.b\n"
+        assert parse_packages_output(output) == ["com.b", "com.a"]
+
 
 class TestParsePackagePath:
     """Tests for parse_package_path."""
@@ -232,6 +262,43 @@ class TestParseDumpsysPackage:
         result_10 = parse_dumpsys_package(output, user_id=10)
         assert result_10["enabled"] is False
 
+    def test_app_label_skips_resource_ids(self) -> None:
+        output = """Packages:
+  Package [com.example.app]
+    applicationInfo=ApplicationInfo{1 com.example.app} labelRes=0x7f120001
+    nonLocalizedLabel="Example" versionCode=42
+    User 0: installed=true enabled=0
+"""
+        result = parse_dumpsys_package(output, user_id=0)
+        assert result["app_label"] == "Example"
+        assert result["version_code"] == 42
+
+    def test_app_label_null_ignored(self) -> None:
+        output = """Packages:
+  Package [com.example.app]
+    labelRes=0x7f0e0001 nonLocalizedLabel=null
+    versionCode=7
+    User 0: installed=true enabled=0
+"""
+        result = parse_dumpsys_package(output, user_id=0)
+        assert result["app_label"] == ""
+        assert result["version_code"] == 7
+
+    def test_hidden_system_package_ignored(self) -> None:
+        output = """Packages:
+  Package [com.android.chrome]
+    versionCode=725815837 minSdk=29 targetSdk=35
+    User 0: installed=true enabled=2
+
+Hidden system packages:
+  Package [com.android.chrome]
+    versionCode=600000000 minSdk=29 targetSdk=33
+    User 0: installed=true enabled=0
+"""
+        result = parse_dumpsys_package(output, user_id=0)
+        assert result["enabled"] is False
+        assert result["version_code"] == 725815837
+
     def test_missing_data(self) -> None:
         output = "Some random output"
         result = parse_dumpsys_package(output, user_id=0)
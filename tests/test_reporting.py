@@ -21,6 +21,7 @@ def test_operation_result() -> None:
     )
     assert failed_result.success is False
     assert failed_result.error == "Permission denied"
+    assert not hasattr(result, "__dict__")
 
 
 def test_operation_report_properties() -> None:
@@ -142,6 +143,8 @@ def test_report_markdown_content() -> None:
         assert "Failed:** 1" in content
 
         # Check results table
+        assert "| ✓ | com.example.app1 |  |" in content
+        assert "| ✗ | com.example.app2 | Permission denied |" in content
         assert "com.example.app1" in content
         assert "com.example.app2" in content
         assert "Permission denied" in content
@@ -0,0 +1,64 @@
+"""Tests for persistent shell sessions, using a local sh in place of adb shell."""
+
+import asyncio
+import shutil
+
+import pytest
+
+from app_freeze.adb.errors import ADBCommandError, ADBTimeoutError
+from app_freeze.adb.session import ShellSession
+
+SH = shutil.which("sh")
+
+pytestmark = pytest.mark.skipif(SH is None, reason="sh not available")
+
+
+def _session() -> ShellSession:
+    assert SH is not None
+    return ShellSession([SH], "local")
+
+
+class TestShellSession:
+    """Tests for ShellSession."""
+
+    def test_runs_commands_in_one_process(self) -> None:
+        async def run() -> tuple[str, str]:
+            async with _session() as session:
+                first = await session.run("echo $$", timeout=5.0)
+                second = await session.run("echo $$", timeout=5.0)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+
+    def test_multi_statement_output(self) -> None:
+        async def run() -> str:
+            async with _session() as session:
+                return await session.run("echo one; echo two", timeout=5.0)
+
+        assert asyncio.run(run()) == "one\ntwo\n"
+
+    def test_output_without_trailing_newline(self) -> None:
+        async def run() -> str:
+            async with _session() as session:
+                return await session.run("printf abc", timeout=5.0)
+
+        assert asyncio.run(run()) == "abc"
+
+    def test_nonzero_exit_raises(self) -> None:
+        async def run() -> None:
+            async with _session() as session:
+                await session.run("echo oops; false", timeout=5.0)
+
+        with pytest.raises(ADBCommandError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.exit_code == 1
+
+    def test_restarts_after_timeout(self) -> None:
+        async def run() -> str:
+            async with _session() as session:
+                with pytest.raises(ADBTimeoutError):
+                    await session.run("sleep 5", timeout=0.05)
+                return await session.run("echo back", timeout=5.0)
+
+        assert asyncio.run(run()) == "back\n"